@@ -363,7 +363,7 @@ Example:
                 error={"message": f"Unknown operation: {operation}"},
             )
         except Exception as e:
-            logger.error(f"Recipe tool error: {e}", exc_info=True)
+            logger.error("Recipe tool error: %s", e, exc_info=True)
             return ToolResult(
                 success=False,
                 error={"message": str(e), "type": type(e).__name__},
@@ -384,7 +384,9 @@ Example:
             if mention_resolver is None:
                 return None
             return mention_resolver.resolve(path_str)
-        return Path(path_str).expanduser()
+        if path_str.startswith("~"):
+            return Path(path_str).expanduser()
+        return Path(path_str)
 
     async def _execute_recipe(self, input: dict[str, Any]) -> ToolResult:
         """Execute recipe from YAML file."""
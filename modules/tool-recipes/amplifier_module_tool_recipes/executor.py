@@ -1,14 +1,21 @@
 """Recipe execution engine."""
 
 import asyncio
+import codecs
 import datetime
 import gc
 import json
 import logging
 import os
 import re
+import shlex
+import shutil
+import signal
 import sys
+import time
 import uuid
+from collections.abc import Awaitable
+from collections.abc import Callable
 from dataclasses import dataclass
 from dataclasses import field
 from pathlib import Path
@@ -51,6 +58,28 @@ _CHECKPOINT_TRIM_THRESHOLD_BYTES: int = 100_000
 # that should be revisited (e.g. use 'output' instead of 'collect').
 _FOREACH_PROGRESS_WARN_BYTES: int = 10_000_000  # 10 MB
 
+# How long a resolved model pattern (e.g. "claude-sonnet-*") is reused before
+# asking the provider again.  Resolution may call the provider's list_models(),
+# a network round-trip for most providers.
+_MODEL_RESOLUTION_TTL_SECONDS: float = 60.0
+
+# {{variable}} references, with multi-level access ({{a.b.c.d}}).  Compiled
+# once: substitution runs for every prompt, command, condition and loop item.
+_VAR_REF_RE = re.compile(r"\{\{(\w+(?:\.\w+)*)\}\}")
+# A string that is exactly one whole-variable reference (surrounding
+# whitespace allowed) — substituted with the native value, not its string form.
+_WHOLE_VAR_REF_RE = re.compile(r"\s*\{\{(\w+(?:\.\w+)*)\}\}\s*")
+
+# Shell for bash steps, resolved once at import.  /bin/bash is preferred (the
+# historical behaviour); systems without it (e.g. NixOS) fall back to the bash
+# on PATH.
+_BASH_PATH: str = (
+    "/bin/bash" if os.path.exists("/bin/bash") else shutil.which("bash") or "/bin/bash"
+)
+
+# Read size used when draining a batched bash session's stdout/stderr pipes.
+_BATCH_READ_CHUNK_BYTES: int = 65_536
+
 # Deduplication set for depends_on advisory warnings.
 # Keyed by recipe_name so each recipe emits at most one warning per process
 # lifetime regardless of how many steps declare depends_on or how many times
@@ -67,6 +96,11 @@ class BashResult:
     exit_code: int
 
 
+# Runs one bash step command: (command, cwd, env, timeout) -> BashResult.
+# Raises asyncio.TimeoutError if the command outlives the timeout.
+CommandRunner = Callable[[str, Path, dict[str, str], float], Awaitable[BashResult]]
+
+
 class SkipRemainingError(Exception):
     """Raised when step fails with on_error='skip_remaining'."""
 
@@ -313,19 +347,178 @@ def _warn_depends_on_unenforced(recipe: "Recipe") -> None:
     )
 
 
+async def _read_until_sentinel(
+    stream: asyncio.StreamReader, sentinel: bytes
+) -> tuple[bytes, bytes | None]:
+    """Read a batched bash command's output up to its end-of-command sentinel.
+
+    The sentinel is followed by a (possibly empty) trailer and a newline; the
+    stdout trailer carries the command's exit status.
+
+    Args:
+        stream: stdout or stderr pipe of the batched bash process.
+        sentinel: Unique marker written after each command.
+
+    Returns:
+        Tuple of (output before the sentinel, trailer). The trailer is None if
+        the stream hit EOF first, i.e. the shell exited mid-command.
+    """
+    buffer = bytearray()
+    search_from = 0
+    while True:
+        index = buffer.find(sentinel, search_from)
+        if index != -1:
+            end = buffer.find(b"\n", index)
+            if end != -1:
+                return bytes(buffer[:index]), bytes(buffer[index + len(sentinel) : end])
+        else:
+            # Only rescan the tail a partially-received sentinel could span
+            search_from = max(0, len(buffer) - len(sentinel) + 1)
+        chunk = await stream.read(_BATCH_READ_CHUNK_BYTES)
+        if not chunk:
+            return bytes(buffer), None
+        buffer.extend(chunk)
+
+
+class _OutputCollector(asyncio.SubprocessProtocol):
+    """Subprocess protocol that collects stdout/stderr text for _run_bash_command.
+
+    Each chunk is UTF-8 decoded as the loop reads it (no StreamReader per pipe,
+    no full-size bytes buffer); `finished` resolves once the process has exited
+    and both pipes are closed.
+    """
+
+    def __init__(self, finished: asyncio.Future[None]):
+        self.finished = finished
+        self._decoders = {
+            fd: codecs.getincrementaldecoder("utf-8")(errors="replace") for fd in (1, 2)
+        }
+        self._chunks: dict[int, list[str]] = {1: [], 2: []}
+
+    def pipe_data_received(self, fd: int, data: bytes) -> None:
+        self._chunks[fd].append(self._decoders[fd].decode(data))
+
+    def text(self, fd: int) -> str:
+        """Return everything decoded from fd, flushing any incomplete sequence."""
+        self._chunks[fd].append(self._decoders[fd].decode(b"", final=True))
+        return "".join(self._chunks[fd])
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        if not self.finished.done():
+            self.finished.set_result(None)
+
+
+async def _run_bash_command(
+    command: str, cwd: Path, env: dict[str, str], timeout: float
+) -> BashResult:
+    """Run a command with `bash -c` (_BASH_PATH) and capture its output.
+
+    This is RecipeExecutor's default CommandRunner.
+
+    Raises:
+        asyncio.TimeoutError: If the command exceeds timeout (it is killed first)
+        OSError: If bash cannot be started
+    """
+    loop = asyncio.get_running_loop()
+    finished: asyncio.Future[None] = loop.create_future()
+    # Use bash explicitly since recipe bash steps may use bash-specific
+    # features like pipefail, &> redirects, brace expansion, arrays, etc.
+    # The default shell (/bin/sh) is often dash on Ubuntu which lacks these.
+    transport, collector = await loop.subprocess_exec(
+        lambda: _OutputCollector(finished),
+        _BASH_PATH,
+        "-c",
+        command,
+        stdin=None,  # inherit, as create_subprocess_exec does
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        cwd=str(cwd),
+        env=env,
+    )
+
+    try:
+        await asyncio.wait_for(asyncio.shield(finished), timeout=timeout)
+    except asyncio.TimeoutError:
+        # Kill the process on timeout
+        transport.kill()
+        raise
+    finally:
+        transport.close()
+
+    return BashResult(
+        stdout=collector.text(1),
+        stderr=collector.text(2),
+        exit_code=transport.get_returncode() or 0,
+    )
+
+
 class RecipeExecutor:
     """Executes recipe workflows with checkpointing and resumption."""
 
-    def __init__(self, coordinator: Any, session_manager: SessionManager):
+    def __init__(
+        self,
+        coordinator: Any,
+        session_manager: SessionManager,
+        command_runner: CommandRunner | None = None,
+    ):
         """
         Initialize executor.
 
         Args:
             coordinator: Amplifier coordinator for agent spawning
             session_manager: Session persistence manager
+            command_runner: Runs bash step commands; defaults to a /bin/bash
+                subprocess per command. Only single-command steps use it:
+                a 'commands' batch always runs in one shared /bin/bash
+                process, since its commands share shell state
         """
         self.coordinator = coordinator
         self.session_manager = session_manager
+        self.command_runner: CommandRunner = command_runner or _run_bash_command
+        # Resolved model patterns keyed by (provider, model_hint), stored as
+        # (time.monotonic() timestamp, resolved model).  See _resolve_model().
+        self._model_resolution_cache: dict[tuple[str, str], tuple[float, str]] = {}
+        self._model_resolution_locks: dict[tuple[str, str], asyncio.Lock] = {}
+
+    async def _resolve_model(self, provider: str, model_hint: str) -> str:
+        """Resolve a model name or glob pattern for a provider, with caching.
+
+        Recipes typically reuse the same pattern across many steps and loop
+        iterations, so results are cached per (provider, model_hint) for
+        _MODEL_RESOLUTION_TTL_SECONDS.  Concurrent resolutions of the same key
+        (e.g. parallel foreach iterations) share a single lookup.
+
+        Args:
+            provider: Provider name from the step configuration
+            model_hint: Model name or glob pattern
+
+        Returns:
+            The resolved model name
+        """
+        key = (provider, model_hint)
+        cached = self._model_resolution_cache.get(key)
+        if cached is not None and (
+            time.monotonic() - cached[0] < _MODEL_RESOLUTION_TTL_SECONDS
+        ):
+            return cached[1]
+
+        lock = self._model_resolution_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Another task may have resolved this key while we waited
+            cached = self._model_resolution_cache.get(key)
+            if cached is not None and (
+                time.monotonic() - cached[0] < _MODEL_RESOLUTION_TTL_SECONDS
+            ):
+                return cached[1]
+
+            model_resolution = await resolve_model_pattern(
+                model_hint=model_hint,
+                provider_name=provider,
+                coordinator=self.coordinator,
+            )
+            resolved_model = model_resolution.resolved_model
+            self._model_resolution_cache[key] = (time.monotonic(), resolved_model)
+            return resolved_model
 
     async def _show_progress(
         self,
@@ -1775,24 +1968,15 @@ DO NOT return the JSON as a string or with escape characters. Return actual JSON
                 # Explicit provider/model preference
                 resolved_model = pref.model
                 if pref.model:
-                    model_resolution = await resolve_model_pattern(
-                        model_hint=pref.model,
-                        provider_name=pref.provider,
-                        coordinator=self.coordinator,
+                    resolved_model = await self._resolve_model(
+                        pref.provider, pref.model
                     )
-                    resolved_model = model_resolution.resolved_model
                 provider_preferences.append(
                     ProviderPreference(provider=pref.provider, model=resolved_model)
                 )
         elif step.provider and step.model:
             # Legacy: Single provider + model fields
-            resolved_model = step.model
-            model_resolution = await resolve_model_pattern(
-                model_hint=step.model,
-                provider_name=step.provider,
-                coordinator=self.coordinator,
-            )
-            resolved_model = model_resolution.resolved_model
+            resolved_model = await self._resolve_model(step.provider, step.model)
             provider_preferences = [
                 ProviderPreference(provider=step.provider, model=resolved_model)
             ]
@@ -2782,8 +2966,7 @@ DO NOT return the JSON as a string or with escape characters. Return actual JSON
         Raises:
             ValueError: If variable syntax invalid or undefined
         """
-        pattern = r"\{\{(\w+(?:\.\w+)*)\}\}"
-        match = re.match(pattern, foreach.strip())
+        match = _VAR_REF_RE.match(foreach.strip())
         if not match:
             raise ValueError(f"Invalid foreach syntax: {foreach}")
 
@@ -2876,7 +3059,7 @@ DO NOT return the JSON as a string or with escape characters. Return actual JSON
             # "{{current_task}}" or "{{a.b.c}}" — optional surrounding
             # whitespace only), resolve and return the native Python object so
             # that dicts, lists, ints, etc. are NOT serialised to JSON strings.
-            whole_var = re.fullmatch(r"\s*\{\{(\w+(?:\.\w+)*)\}\}\s*", value)
+            whole_var = _WHOLE_VAR_REF_RE.fullmatch(value)
             if whole_var:
                 var_ref = whole_var.group(1)
                 if "." in var_ref:
@@ -2916,8 +3099,9 @@ DO NOT return the JSON as a string or with escape characters. Return actual JSON
         Raises:
             ValueError if variable undefined
         """
-        # Support multi-level access: {{a.b.c.d}} - use * not ? for unlimited depth
-        pattern = r"\{\{(\w+(?:\.\w+)*)\}\}"
+        # Most cwd/env values and many commands contain no references at all
+        if "{{" not in template:
+            return template
 
         def replace(match: re.Match) -> str:
             var_ref = match.group(1)
@@ -2946,7 +3130,7 @@ DO NOT return the JSON as a string or with escape characters. Return actual JSON
                 return json.dumps(value)
             return str(value)
 
-        return re.sub(pattern, replace, template)
+        return _VAR_REF_RE.sub(replace, template)
 
     async def _execute_bash_step(
         self,
@@ -2957,10 +3141,11 @@ DO NOT return the JSON as a string or with escape characters. Return actual JSON
         """
         Execute a bash step by running shell command directly.
 
-        No LLM overhead - command is executed via subprocess.
+        No LLM overhead - command is executed via self.command_runner (a bash
+        subprocess by default); a commands list runs in one shared bash process.
 
         Args:
-            step: Step with type="bash" and command
+            step: Step with type="bash" and command (or commands)
             context: Current context variables
             project_path: Current project directory
 
@@ -2971,10 +3156,9 @@ DO NOT return the JSON as a string or with escape characters. Return actual JSON
             ValueError: If command fails and on_error="fail"
             asyncio.TimeoutError: If command exceeds timeout
         """
-        assert step.command is not None, "Bash step must have command"
-
-        # Substitute variables in command
-        command = self.substitute_variables(step.command, context)
+        assert step.command is not None or step.commands, (
+            "Bash step must have command or commands"
+        )
 
         # Determine working directory
         if step.cwd:
@@ -3000,47 +3184,30 @@ DO NOT return the JSON as a string or with escape characters. Return actual JSON
                 # Substitute variables in env values
                 env[key] = self.substitute_variables(str(value), context)
 
-        # Execute command with timeout
-        # Use /bin/bash explicitly since recipe bash steps may use bash-specific
-        # features like pipefail, &> redirects, brace expansion, arrays, etc.
-        # The default shell (/bin/sh) is often dash on Ubuntu which lacks these.
         try:
-            process = await asyncio.create_subprocess_exec(
-                "/bin/bash",
-                "-c",
-                command,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=str(cwd),
-                env=env,
-            )
-
-            try:
-                stdout_bytes, stderr_bytes = await asyncio.wait_for(
-                    process.communicate(),
-                    timeout=step.timeout,
-                )
-            except asyncio.TimeoutError:
-                # Kill the process on timeout
-                process.kill()
-                await process.wait()
-                raise ValueError(
-                    f"Step '{step.id}': command timed out after {step.timeout}s"
-                ) from None
-
-            stdout = stdout_bytes.decode("utf-8", errors="replace")
-            stderr = stderr_bytes.decode("utf-8", errors="replace")
-            exit_code = process.returncode or 0
-
-            result = BashResult(stdout=stdout, stderr=stderr, exit_code=exit_code)
+            if step.commands:
+                commands = [
+                    self.substitute_variables(cmd, context) for cmd in step.commands
+                ]
+                result = await self._execute_batch_bash_step(step, commands, cwd, env)
+            else:
+                # Substitute variables in command
+                assert step.command is not None
+                command = self.substitute_variables(step.command, context)
+                try:
+                    result = await self.command_runner(command, cwd, env, step.timeout)
+                except asyncio.TimeoutError:
+                    raise ValueError(
+                        f"Step '{step.id}': command timed out after {step.timeout}s"
+                    ) from None
 
             # Check for non-zero exit code
-            if exit_code != 0:
+            if result.exit_code != 0:
                 error_msg = (
-                    f"Step '{step.id}': command failed with exit code {exit_code}"
+                    f"Step '{step.id}': command failed with exit code {result.exit_code}"
                 )
-                if stderr.strip():
-                    error_msg += f"\nstderr: {stderr.strip()}"
+                if result.stderr.strip():
+                    error_msg += f"\nstderr: {result.stderr.strip()}"
 
                 if step.on_error == "fail":
                     raise ValueError(error_msg)
@@ -3052,3 +3219,104 @@ DO NOT return the JSON as a string or with escape characters. Return actual JSON
 
         except OSError as e:
             raise ValueError(f"Step '{step.id}': failed to execute command: {e}") from e
+
+    async def _execute_batch_bash_step(
+        self,
+        step: Step,
+        commands: list[str],
+        cwd: Path,
+        env: dict[str, str],
+    ) -> BashResult:
+        """
+        Run a bash step's commands in a single bash process fed through stdin.
+
+        Each command is followed by a sentinel on stdout (carrying its exit
+        status) and on stderr, so output is demultiplexed without spawning a
+        new shell per command. Commands share one shell session: variables
+        and `cd` carry over. Execution stops at the first non-zero exit
+        status; step.timeout bounds the whole batch.
+
+        Args:
+            step: Step with type="bash" and commands
+            commands: Commands with variables already substituted
+            cwd: Working directory for the shell
+            env: Environment for the shell
+
+        Returns:
+            BashResult with the commands' combined output and the exit code
+            of the last command run
+
+        Raises:
+            ValueError: If the batch exceeds step.timeout
+        """
+        sentinel = f"__AMP_EOC_{uuid.uuid4().hex}__"
+        process = await asyncio.create_subprocess_exec(
+            _BASH_PATH,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=str(cwd),
+            env=env,
+            # Own process group, so a timeout can kill commands bash has forked
+            start_new_session=True,
+        )
+        assert process.stdin is not None
+        assert process.stdout is not None
+        assert process.stderr is not None
+        stdout_parts: list[bytes] = []
+        stderr_parts: list[bytes] = []
+
+        async def run_commands() -> int:
+            for command in commands:
+                # eval the quoted command so a syntax error (unterminated
+                # quote or heredoc, trailing backslash) fails with status 2
+                # instead of swallowing the sentinels. The group runs in this
+                # shell with stdin from /dev/null so a command cannot consume
+                # the rest of the batch script.
+                script = (
+                    f"{{ eval {shlex.quote(command)}\n}} </dev/null\n"
+                    f"printf '%s%d\\n' '{sentinel}' \"$?\"\n"
+                    f"printf '%s\\n' '{sentinel}' >&2\n"
+                )
+                process.stdin.write(script.encode("utf-8"))
+                await process.stdin.drain()
+                (out, status), (err, _) = await asyncio.gather(
+                    _read_until_sentinel(process.stdout, sentinel.encode()),
+                    _read_until_sentinel(process.stderr, sentinel.encode()),
+                )
+                stdout_parts.append(out)
+                stderr_parts.append(err)
+                if status is None:
+                    # Shell exited mid-command (e.g. `exit 3`)
+                    process.stdin.close()
+                    return await process.wait()
+                exit_code = int(status)
+                if exit_code != 0:
+                    break
+            else:
+                exit_code = 0
+            process.stdin.close()
+            await process.wait()
+            return exit_code
+
+        try:
+            exit_code = await asyncio.wait_for(run_commands(), timeout=step.timeout)
+        except asyncio.TimeoutError:
+            raise ValueError(
+                f"Step '{step.id}': command timed out after {step.timeout}s"
+            ) from None
+        finally:
+            # Timed out, cancelled, or failed mid-batch: don't leave the shell
+            # (or anything it forked) running
+            if process.returncode is None:
+                try:
+                    os.killpg(process.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+                await process.wait()
+
+        return BashResult(
+            stdout=b"".join(stdout_parts).decode("utf-8", errors="replace"),
+            stderr=b"".join(stderr_parts).decode("utf-8", errors="replace"),
+            exit_code=exit_code,
+        )
@@ -4,20 +4,76 @@ Supports boolean expressions with:
 - Comparison: == != < > >= <=
 - Boolean operators: and or not
 - Parenthesized grouping: (expr)
-- Variable references: {{variable}}
+- Variable references: {{variable}}, optionally written flush against other
+  references or bare words to concatenate them: {{major}}.{{minor}}
 - String literals: 'value' or "value" (with escape sequences: \\, \', \")
 - Numeric literals: 42, 3.14
 
-Implemented as a recursive descent parser with proper operator precedence:
+Implemented as an iterative shunting-yard parser with proper operator
+precedence:
   or (lowest) -> and -> not -> comparison -> atom (highest)
 
+Expressions are compiled to a small tuple AST which is cached per
+expression string; variable references stay symbolic in the AST and are
+resolved against the context at evaluation time.
+
 NO eval() or exec() - safe string parsing only.
 """
 
+import functools
+import operator
 import re
+import sys
 from typing import Any
 
 
+# Tokenizer: one alternative per token kind, tried in order at each
+# position.  Unnamed whitespace matches are skipped; a position where nothing
+# matches is an unterminated string or an unexpected character.
+_TOKEN_RE = re.compile(
+    r"""
+      \s+
+    | (?P<STR>'(?:\\[\s\S]|[^'\\])*'|"(?:\\[\s\S]|[^"\\])*")
+    | (?P<VAR>\{\{(?P<path>\w+(?:\.\w+)*)\}\})
+    | (?P<PAREN>[()])
+    | (?P<OP>[=!<>]=|[<>])
+    | (?P<WORD>[\w.]+)
+    """,
+    re.VERBOSE,
+)
+
+# The overwhelmingly common condition shape: one comparison of two simple
+# operands ({{var}}, quoted string without escapes, or bare word), e.g.
+# "{{status}} == 'success'" or "{{a}} != {{b}}".  Compiled without going
+# through the tokenizer and parser.
+_SIMPLE_OPERAND = r"""\{\{(\w+(?:\.\w+)*)\}\}|'([^'\\]*)'|"([^"\\]*)"|([\w.]+)"""
+_SIMPLE_COMPARISON_RE = re.compile(
+    rf"\s*(?:{_SIMPLE_OPERAND})\s*(==|!=|<=|>=|<|>)\s*(?:{_SIMPLE_OPERAND})\s*"
+)
+
+# Comparison operators, shared by numeric and string comparison.  Keys are
+# interned, as is operator text from the tokenizer, so lookups hit on identity.
+_COMPARATORS = {
+    sys.intern(op): fn
+    for op, fn in (
+        ("==", operator.eq),
+        ("!=", operator.ne),
+        ("<", operator.lt),
+        (">", operator.gt),
+        (">=", operator.ge),
+        ("<=", operator.le),
+    )
+}
+
+# Characters a float() literal can start with: sign, decimal point, ASCII
+# digits, and the i/n of inf/infinity/nan.  Whitespace and non-ASCII digits
+# are also accepted by float() and are checked separately.
+_NUMERIC_START = frozenset("+-.0123456789iInN")
+
+# String values treated as false when a bare value is used as a condition.
+_FALSY = frozenset(("false", "False", "", "0", "none", "None"))
+
+
 class ExpressionError(Exception):
     """Error evaluating condition expression."""
 
@@ -27,6 +83,11 @@ class ExpressionError(Exception):
 def evaluate_condition(expression: str, context: dict[str, Any]) -> bool:
     """Evaluate a condition expression against context.
 
+    The expression is compiled once into an AST (cached per expression
+    string) and the AST is walked against ``context``; variables are
+    resolved at evaluation time so the same compiled form serves every
+    context.
+
     Args:
         expression: Condition string (e.g., "{{status}} == 'success'")
         context: Dictionary of variable values
@@ -40,40 +101,168 @@ def evaluate_condition(expression: str, context: dict[str, Any]) -> bool:
     if not expression or not expression.strip():
         return True  # Empty condition = always true
 
-    # Substitute variables first
-    substituted = _substitute_variables(expression, context)
-
-    # Parse and evaluate the expression
     try:
-        return _evaluate_expression(substituted.strip())
+        node = _compile(expression.strip())
     except ExpressionError as e:
         raise ExpressionError(f"Invalid expression: {e}") from e
 
+    return _evaluate_node(node, context)
+
+
+# ---------------------------------------------------------------------------
+# AST
+#
+# Expressions compile to nested tuples:
+#   ("or", left, right) / ("and", left, right) / ("not", operand)
+#   ("cmp", op, left_atom, right_atom)  -- comparison of two atoms
+#   ("truth", atom)                     -- bare atom tested for truthiness
+# Atoms (comparison operands):
+#   ("lit", value)  -- literal value (unquoted/normalized at compile time)
+#   ("var", path, parts) -- {{variable}} reference; the dotted path is split
+#                           into parts once, resolved at evaluation time
+#   ("group", node) -- parenthesized sub-expression
+#   ("cat", atoms)  -- references and bare words written with no space
+#                      between them (e.g. {{major}}.{{minor}}), compared as
+#                      the concatenation of their values
+# ---------------------------------------------------------------------------
+
+
+@functools.lru_cache(maxsize=512)
+def _compile(expression: str) -> tuple:
+    """Tokenize and parse an expression into its AST.
+
+    Cached by expression string: recipe conditions are re-evaluated many
+    times with only the context varying.
+
+    Raises:
+        ExpressionError: On unterminated strings, invalid characters or
+            syntax errors (not cached)
+    """
+    node = _compile_simple_comparison(expression)
+    if node is not None:
+        return node
+    return _parse(_tokenize(expression))
+
+
+def _compile_simple_comparison(expression: str) -> tuple | None:
+    """Compile a single simple comparison directly, bypassing the parser.
+
+    Returns:
+        The "cmp" node, or None if the expression is not of that shape (the
+        general tokenizer/parser then handles it, including any errors)
+    """
+    match = _SIMPLE_COMPARISON_RE.fullmatch(expression)
+    if match is None:
+        return None
+    groups = match.groups()
+    left = _simple_operand(*groups[0:4])
+    right = _simple_operand(*groups[5:9])
+    if left is None or right is None:
+        return None
+    return ("cmp", sys.intern(groups[4]), left, right)
+
+
+def _simple_operand(
+    var: str | None, single: str | None, double: str | None, word: str | None
+) -> tuple | None:
+    """Build the atom for one operand matched by _SIMPLE_COMPARISON_RE."""
+    if var is not None:
+        return _var_node(var)
+    # Quoted strings matched here contain no escapes
+    if single is not None:
+        return ("lit", single)
+    if double is not None:
+        return ("lit", double)
+    if word in ("and", "or", "not"):
+        return None
+    return ("lit", _literal_value("WORD", word))
+
+
+def _evaluate_node(node: tuple, context: dict[str, Any]) -> bool:
+    """Evaluate a compiled expression node to a boolean.
+
+    Both sides of 'and'/'or' are always evaluated so that an undefined
+    variable anywhere in the expression is reported.
+    """
+    kind = node[0]
+    if kind == "cmp":
+        return _compare(
+            node[1],
+            _operand_value(node[2], context),
+            _operand_value(node[3], context),
+        )
+    if kind == "truth":
+        # Boolean normalization: falsy strings are listed in _FALSY, any other
+        # value (including 'true'/'True' and non-empty strings) is truthy
+        return _operand_value(node[1], context) not in _FALSY
+    if kind == "and":
+        left = _evaluate_node(node[1], context)
+        right = _evaluate_node(node[2], context)
+        return left and right
+    if kind == "or":
+        left = _evaluate_node(node[1], context)
+        right = _evaluate_node(node[2], context)
+        return left or right
+    # "not"
+    return not _evaluate_node(node[1], context)
+
+
+def _operand_value(atom: tuple, context: dict[str, Any]) -> str:
+    """Resolve an atom to the string form used for comparison."""
+    kind = atom[0]
+    if kind == "lit":
+        return atom[1]
+    if kind == "cat":
+        return "".join(_operand_value(part, context) for part in atom[1])
+    if kind == "var":
+        value = _resolve_variable(atom[2], context)
+        if value is None:
+            raise ExpressionError(f"Undefined variable: {atom[1]}")
+        if isinstance(value, str):
+            return value
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        return str(value)
+    # "group"
+    return "true" if _evaluate_node(atom[1], context) else "false"
+
+
+def _compare(op: str, left: str, right: str) -> bool:
+    """Compare two operand values (numeric-first, fall back to string)."""
+    left_num = _try_numeric(left)
+    right_num = _try_numeric(right)
 
-def _escape_string_value(value: str) -> str:
-    """Escape a string value for safe embedding in single-quoted literal.
+    if left_num is not None and right_num is not None:
+        # Both numeric - compare as numbers
+        return _COMPARATORS[op](left_num, right_num)
+    return _COMPARATORS[op](left, right)
 
-    Escapes backslashes and single quotes so the value can be safely
-    wrapped in single quotes without breaking tokenization.
+
+def _literal_value(kind: str, text: str) -> str:
+    """Compute the comparison value of a literal token at compile time.
+
+    Quoted strings are stripped of their quotes and unescaped. Boolean
+    literals (true/false) are normalized to lowercase for case-insensitive
+    comparison. Other bare values are used as written.
 
     Args:
-        value: Raw string value from context
+        kind: Token kind ("STR" or "WORD")
+        text: Token text as written
 
     Returns:
-        Escaped string safe for embedding in 'quotes'
+        String value for comparison
     """
-    # Escape backslashes first (so we don't double-escape the quote escapes)
-    value = value.replace("\\", "\\\\")
-    # Escape single quotes
-    value = value.replace("'", "\\'")
-    return value
+    if kind == "STR":
+        return _unescape_string_value(text[1:-1])
+    lowered = text.lower()
+    if lowered in ("true", "false"):
+        return lowered
+    return text
 
 
 def _unescape_string_value(value: str) -> str:
     """Unescape a string value after extracting from quoted literal.
 
-    Reverses the escaping done by _escape_string_value.
-
     Args:
         value: Escaped string from tokenizer (quotes already stripped)
 
@@ -87,30 +276,13 @@ def _unescape_string_value(value: str) -> str:
     return value
 
 
-def _substitute_variables(expression: str, context: dict[str, Any]) -> str:
-    """Replace {{variable}} references with their values."""
-    pattern = re.compile(r"\{\{(\w+(?:\.\w+)*)\}\}")
-
-    def replace_var(match: re.Match) -> str:
-        var_path = match.group(1)
-        value = _resolve_variable(var_path, context)
-        if value is None:
-            raise ExpressionError(f"Undefined variable: {var_path}")
-        # Convert to string representation for comparison
-        if isinstance(value, str):
-            # Escape special characters before wrapping in quotes
-            escaped = _escape_string_value(value)
-            return f"'{escaped}'"
-        if isinstance(value, bool):
-            return "true" if value else "false"
-        return str(value)
-
-    return pattern.sub(replace_var, expression)
+def _var_node(path: str) -> tuple:
+    """Build a variable atom, splitting its dotted path once at compile time."""
+    return ("var", path, tuple(path.split(".")))
 
 
-def _resolve_variable(path: str, context: dict[str, Any]) -> Any:
-    """Resolve dotted variable path (e.g., 'step.id')."""
-    parts = path.split(".")
+def _resolve_variable(parts: tuple[str, ...], context: dict[str, Any]) -> Any:
+    """Resolve a split dotted variable path (e.g., ('step', 'id'))."""
     value = context
     for part in parts:
         if isinstance(value, dict) and part in value:
@@ -120,22 +292,6 @@ def _resolve_variable(path: str, context: dict[str, Any]) -> Any:
     return value
 
 
-def _evaluate_expression(expr: str) -> bool:
-    """Evaluate substituted expression to boolean.
-
-    Uses a recursive descent parser with proper operator precedence:
-      or (lowest) -> and -> not -> comparison -> atom (highest)
-    """
-    expr = expr.strip()
-    if not expr:
-        return True
-
-    tokens = _tokenize(expr)
-    parser = _Parser(tokens)
-    result = parser.parse()
-    return result
-
-
 def _parse_value(token: str) -> str | bool:
     """Parse a value token (string literal or boolean)."""
     token = token.strip()
@@ -159,15 +315,7 @@ def _parse_value(token: str) -> str | bool:
 
 
 # ---------------------------------------------------------------------------
-# Recursive descent parser stubs (to be implemented)
-#
-# These functions will replace the string-split approach in _evaluate_expression
-# with a proper tokenizer + recursive descent parser supporting:
-#   - Comparison operators: < > >= <= == !=
-#   - Boolean operators: and, or, not (with correct precedence)
-#   - Parenthesized grouping: (expr)
-#   - Numeric comparison (numeric-first, fall back to string)
-#   - Boolean normalization for truthy/falsy values
+# Tokenizer + parser
 #
 # Grammar (precedence low→high):
 #   expression  := or_expr
@@ -175,15 +323,24 @@ def _parse_value(token: str) -> str | bool:
 #   and_expr    := not_expr ("and" not_expr)*
 #   not_expr    := "not" not_expr | comparison
 #   comparison  := atom (("==" | "!=" | "<" | ">" | ">=" | "<=") atom)?
-#   atom        := "(" expression ")" | string_literal | number | boolean | identifier
+#   atom        := "(" expression ")" | variable | string_literal | number
+#                  | boolean | identifier
 # ---------------------------------------------------------------------------
 
 
-def _tokenize(expression: str) -> list[str]:
-    """Tokenize an expression string into a list of tokens.
+def _tokenize(expression: str) -> list[tuple[str, Any]]:
+    """Tokenize an expression string into a list of typed tokens.
 
-    Token types: string literals ('...'/\"...\"), operators (== != < > >= <=),
-    keywords (and or not), parentheses, numbers, and bare identifiers.
+    Each token is a ``(kind, text)`` pair so the parser never has to
+    re-inspect token text to classify it:
+    - "STR": string literal, quotes intact ('...'/\"...\")
+    - "VAR": variable reference, text is the dotted path inside {{...}}
+    - "OP": comparison operator (== != < > >= <=)
+    - "KW": keyword (and or not)
+    - "(" / ")": parentheses
+    - "WORD": number, boolean literal or bare identifier
+    - "CAT": variable references and bare words with no whitespace between
+      them (e.g. ``{{major}}.{{minor}}``); text is a tuple of their atoms
 
     Supports escape sequences within string literals:
     - \\' for literal single quote
@@ -191,290 +348,218 @@ def _tokenize(expression: str) -> list[str]:
     - \\\\ for literal backslash
 
     Args:
-        expression: Substituted expression string (variables already replaced)
+        expression: Raw expression string
 
     Returns:
-        List of token strings
+        List of (kind, text) tokens
 
     Raises:
         ExpressionError: On unterminated strings or invalid characters
     """
-    tokens: list[str] = []
-    i = 0
-    n = len(expression)
-
-    while i < n:
-        ch = expression[i]
-
-        # Skip whitespace
-        if ch.isspace():
-            i += 1
+    tokens: list[tuple[str, Any]] = []
+    pos = 0
+    # End of the last VAR/WORD/CAT token, for detecting adjacent operands
+    joinable_end = -1
+
+    for match in _TOKEN_RE.finditer(expression):
+        if match.start() != pos:
+            # Nothing matches at pos: report the first untokenizable character
+            _raise_untokenizable(expression, pos)
+        pos = match.end()
+
+        kind = match.lastgroup
+        if kind is None:  # whitespace
             continue
-
-        # String literals (single or double quoted) with escape sequence support
-        if ch in ("'", '"'):
-            quote = ch
-            j = i + 1
-            while j < n:
-                if expression[j] == '\\' and j + 1 < n:
-                    # Skip escaped character (handles \', \", \\)
-                    j += 2
-                elif expression[j] == quote:
-                    # Found unescaped closing quote
-                    break
-                else:
-                    j += 1
-            if j >= n:
-                raise ExpressionError(
-                    f"Unterminated string literal starting at position {i}"
+        if kind == "VAR" or (
+            kind == "WORD" and match.group() not in ("and", "or", "not")
+        ):
+            if match.start() == joinable_end:
+                # Written flush against the previous operand: one operand
+                # whose value is the concatenation (e.g. {{n}}0 == 50)
+                atom = (
+                    _var_node(match.group("path"))
+                    if kind == "VAR"
+                    else ("lit", match.group())
                 )
-            # Include quotes in token so _parse_atom can identify it
-            tokens.append(expression[i : j + 1])
-            i = j + 1
-            continue
-
-        # Parentheses
-        if ch in ("(", ")"):
-            tokens.append(ch)
-            i += 1
-            continue
-
-        # Two-character operators: ==, !=, >=, <=
-        if i + 1 < n and expression[i : i + 2] in ("==", "!=", ">=", "<="):
-            tokens.append(expression[i : i + 2])
-            i += 2
-            continue
-
-        # Single-character operators: <, >
-        if ch in ("<", ">"):
-            tokens.append(ch)
-            i += 1
-            continue
-
-        # Words (keywords and identifiers) and numbers
-        if ch.isalnum() or ch == "_" or ch == ".":
-            j = i
-            while j < n and (expression[j].isalnum() or expression[j] in ("_", ".")):
-                j += 1
-            tokens.append(expression[i:j])
-            i = j
-            continue
+                tokens[-1] = ("CAT", _cat_atoms(tokens[-1]) + (atom,))
+                joinable_end = pos
+                continue
+            joinable_end = pos
+        if kind == "VAR":
+            tokens.append(("VAR", match.group("path")))
+        elif kind == "PAREN":
+            text = match.group()
+            tokens.append((text, text))
+        elif kind == "OP":
+            # Interned: operator text ends up in cached AST nodes and is used
+            # as the _COMPARATORS key on every evaluation
+            tokens.append(("OP", sys.intern(match.group())))
+        elif kind == "WORD":
+            word = match.group()
+            if word in ("and", "or", "not"):
+                tokens.append(("KW", sys.intern(word)))
+            else:
+                tokens.append(("WORD", word))
+        else:
+            # Include quotes in token text; stripped by _literal_value
+            tokens.append(("STR", match.group()))
 
-        raise ExpressionError(f"Unexpected character '{ch}' at position {i}")
+    if pos != len(expression):
+        _raise_untokenizable(expression, pos)
 
     return tokens
 
 
-def _is_truthy(value: str) -> bool:
-    """Determine if a string value is truthy using boolean normalization.
-
-    Falsy values: 'false', 'False', '', '0', 'none', 'None'
-    Truthy values: 'true', 'True', any other non-empty string
+def _cat_atoms(token: tuple[str, Any]) -> tuple:
+    """Return the atoms of a token that an adjacent operand is joined onto."""
+    kind, text = token
+    if kind == "CAT":
+        return text
+    if kind == "VAR":
+        return (_var_node(text),)
+    # WORD: taken as written, as it is part of a larger word
+    return (("lit", text),)
 
-    Args:
-        value: String value to test
 
-    Returns:
-        True if value is truthy, False otherwise
-    """
-    return value not in ("false", "False", "", "0", "none", "None")
+def _raise_untokenizable(expression: str, pos: int) -> None:
+    """Raise the tokenizer error for the character at ``pos``."""
+    ch = expression[pos]
+    if ch in ("'", '"'):
+        raise ExpressionError(
+            f"Unterminated string literal starting at position {pos}"
+        )
+    raise ExpressionError(f"Unexpected character '{ch}' at position {pos}")
 
 
 def _try_numeric(value: str) -> float | None:
     """Attempt to parse a string as a number for numeric comparison.
 
+    Most operands are words like 'success' that cannot be numbers, so the
+    first character is checked before paying for float() raising and
+    catching ValueError.
+
     Args:
         value: String to attempt numeric parsing on
 
     Returns:
         Float value if parseable, None otherwise
     """
+    if not value:
+        return None
+    first = value[0]
+    if first not in _NUMERIC_START and not first.isdigit() and not first.isspace():
+        return None
     try:
         return float(value)
     except (ValueError, TypeError):
         return None
 
 
-class _Parser:
-    """Recursive descent parser for condition expressions.
+# Parser states: what the next token may be.
+_EXPECT_OPERAND = 0  # start of a not_expr: 'not', '(' or an atom
+_EXPECT_ATOM = 1  # right-hand side of a comparison: '(' or an atom
+_EXPECT_OPERATOR = 2  # after an atom: comparison, and/or, ')' or end
+_EXPECT_BOOLEAN = 3  # after a comparison: and/or, ')' or end
 
-    Consumes a token list and produces a boolean result using
-    proper operator precedence.
+# Binding strength of the boolean operators ('not' is a prefix operator).
+_PRECEDENCE = {"or": 1, "and": 2, "not": 3}
 
-    Attributes:
-        tokens: List of token strings from _tokenize()
-        pos: Current position in the token list
-    """
+_ATOM_KINDS = frozenset(("lit", "var", "group", "cat"))
 
-    COMPARISON_OPS = ("==", "!=", "<", ">", ">=", "<=")
 
-    def __init__(self, tokens: list[str]) -> None:
-        self.tokens = tokens
-        self.pos = 0
+def _as_expr(node: tuple) -> tuple:
+    """Wrap a bare atom used as a boolean operand in a truthiness test."""
+    if node[0] in _ATOM_KINDS:
+        return ("truth", node)
+    return node
 
-    def _peek(self) -> str | None:
-        """Return current token without consuming, or None if at end."""
-        if self.pos < len(self.tokens):
-            return self.tokens[self.pos]
-        return None
 
-    def _consume(self) -> str:
-        """Consume and return current token."""
-        token = self.tokens[self.pos]
-        self.pos += 1
-        return token
-
-    def parse(self) -> bool:
-        """Parse the full expression and return boolean result.
-
-        Raises:
-            ExpressionError: On syntax errors or unexpected tokens
-        """
-        result = self._parse_or()
-        if self.pos < len(self.tokens):
-            raise ExpressionError(
-                f"Unexpected token '{self.tokens[self.pos]}' at position {self.pos}"
-            )
-        return result
-
-    def _parse_or(self) -> bool:
-        """Parse or-expression: and_expr ('or' and_expr)*."""
-        left = self._parse_and()
-        while self._peek() == "or":
-            self._consume()  # eat 'or'
-            right = self._parse_and()
-            left = left or right
-        return left
-
-    def _parse_and(self) -> bool:
-        """Parse and-expression: not_expr ('and' not_expr)*."""
-        left = self._parse_not()
-        while self._peek() == "and":
-            self._consume()  # eat 'and'
-            right = self._parse_not()
-            left = left and right
-        return left
-
-    def _parse_not(self) -> bool:
-        """Parse not-expression: 'not' not_expr | comparison."""
-        if self._peek() == "not":
-            self._consume()  # eat 'not'
-            value = self._parse_not()  # recursive for chained not
-            return not value
-        return self._parse_comparison()
-
-    def _parse_comparison(self) -> bool:
-        """Parse comparison: atom (comp_op atom)?
-
-        Supports: == != < > >= <=
-        Numeric-first comparison (try float, fall back to string).
-        """
-        left_val = self._parse_atom()
-
-        if self._peek() in self.COMPARISON_OPS:
-            op = self._consume()
-            right_val = self._parse_atom()
-
-            # Strip quotes and unescape for comparison
-            left_cmp = self._extract_string_value(left_val)
-            right_cmp = self._extract_string_value(right_val)
-
-            # Numeric-first comparison
-            left_num = _try_numeric(left_cmp)
-            right_num = _try_numeric(right_cmp)
-
-            if left_num is not None and right_num is not None:
-                # Both numeric - compare as numbers
-                if op == "==":
-                    return left_num == right_num
-                if op == "!=":
-                    return left_num != right_num
-                if op == "<":
-                    return left_num < right_num
-                if op == ">":
-                    return left_num > right_num
-                if op == ">=":
-                    return left_num >= right_num
-                if op == "<=":
-                    return left_num <= right_num
+def _parse(tokens: list[tuple[str, Any]]) -> tuple:
+    """Parse a typed token list into an AST (see ``_compile``).
+
+    Iterative shunting-yard over the token stream with an operand stack and
+    an operator stack. Boolean operators are ordered by ``_PRECEDENCE``;
+    comparisons bind atoms only, so a pending comparison is reduced as soon
+    as its right-hand atom is complete.
+
+    Raises:
+        ExpressionError: On syntax errors or unexpected tokens
+    """
+    operands: list[tuple] = []
+    operators: list[str] = []
+    state = _EXPECT_OPERAND
+
+    def reduce(op: str) -> None:
+        if op == "not":
+            operands.append(("not", _as_expr(operands.pop())))
+        elif op in _PRECEDENCE:
+            right = _as_expr(operands.pop())
+            left = _as_expr(operands.pop())
+            operands.append((op, left, right))
+        else:
+            right = operands.pop()
+            left = operands.pop()
+            operands.append(("cmp", op, left, right))
+
+    def atom_complete() -> int:
+        # A comparison waiting for its right-hand side can now be reduced
+        if operators and operators[-1] not in _PRECEDENCE and operators[-1] != "(":
+            reduce(operators.pop())
+            return _EXPECT_BOOLEAN
+        return _EXPECT_OPERATOR
+
+    for pos, (kind, text) in enumerate(tokens):
+        if state in (_EXPECT_OPERAND, _EXPECT_ATOM):
+            if kind in ("VAR", "STR", "WORD", "CAT"):
+                if kind == "VAR":
+                    operands.append(_var_node(text))
+                elif kind == "CAT":
+                    operands.append(("cat", text))
+                else:
+                    operands.append(("lit", _literal_value(kind, text)))
+                state = atom_complete()
+            elif kind == "(":
+                operators.append("(")
+                state = _EXPECT_OPERAND
+            elif kind == "KW" and text == "not" and state == _EXPECT_OPERAND:
+                operators.append("not")
+            elif kind == "KW":
+                raise ExpressionError(
+                    f"Unexpected keyword '{text}' where value expected"
+                )
             else:
-                # String comparison
-                if op == "==":
-                    return left_cmp == right_cmp
-                if op == "!=":
-                    return left_cmp != right_cmp
-                if op == "<":
-                    return left_cmp < right_cmp
-                if op == ">":
-                    return left_cmp > right_cmp
-                if op == ">=":
-                    return left_cmp >= right_cmp
-                if op == "<=":
-                    return left_cmp <= right_cmp
-
-        # No comparison operator - interpret as boolean via truthiness
-        stripped = self._extract_string_value(left_val)
-        return _is_truthy(stripped)
-
-    def _extract_string_value(self, token: str) -> str:
-        """Extract and unescape string value from a token.
-
-        Handles quoted strings (strips quotes and unescapes) and bare values.
-        Boolean literals (true/false) are normalized to lowercase for
-        case-insensitive comparison.
-
-        Args:
-            token: Raw token from tokenizer
-
-        Returns:
-            Unescaped string value for comparison
-        """
-        if (token.startswith("'") and token.endswith("'")) or (
-            token.startswith('"') and token.endswith('"')
-        ):
-            # Strip quotes and unescape
-            inner = token[1:-1]
-            return _unescape_string_value(inner)
-        # Normalize boolean literals to lowercase (case-insensitive)
-        if token.lower() in ("true", "false"):
-            return token.lower()
-        return token
-
-    def _parse_atom(self) -> str:
-        """Parse atom: '(' expression ')' | literal | identifier.
-
-        Returns the raw string value of the atom for comparison operators
-        to consume.
-        """
-        token = self._peek()
-
-        if token is None:
-            raise ExpressionError("Unexpected end of expression")
-
-        # Parenthesized sub-expression
-        if token == "(":
-            self._consume()  # eat '('
-            result = self._parse_or()
-            if self._peek() != ")":
-                raise ExpressionError("Expected ')' to close parenthesized expression")
-            self._consume()  # eat ')'
-            # Return a synthetic token representing the boolean result
-            return "true" if result else "false"
-
-        # String literals (quoted)
-        if (token.startswith("'") and token.endswith("'")) or (
-            token.startswith('"') and token.endswith('"')
-        ):
-            self._consume()
-            return token  # Return with quotes intact; _parse_comparison strips them
+                raise ExpressionError(
+                    f"Unexpected operator '{text}' where value expected"
+                )
+        elif kind == "KW" and text in ("and", "or"):
+            precedence = _PRECEDENCE[text]
+            while (
+                operators
+                and operators[-1] != "("
+                and _PRECEDENCE[operators[-1]] >= precedence
+            ):
+                reduce(operators.pop())
+            operators.append(text)
+            state = _EXPECT_OPERAND
+        elif kind == "OP" and state == _EXPECT_OPERATOR:
+            operators.append(text)
+            state = _EXPECT_ATOM
+        elif kind == ")" and "(" in operators:
+            while operators[-1] != "(":
+                reduce(operators.pop())
+            operators.pop()  # discard '('
+            operands.append(("group", _as_expr(operands.pop())))
+            state = atom_complete()
+        else:
+            raise ExpressionError(f"Unexpected token '{text}' at position {pos}")
 
-        # Keywords that are NOT operators get returned as values
-        if token in ("and", "or", "not"):
-            raise ExpressionError(f"Unexpected keyword '{token}' where value expected")
+    if state in (_EXPECT_OPERAND, _EXPECT_ATOM):
+        raise ExpressionError("Unexpected end of expression")
 
-        if token in (")", "==", "!=", "<", ">", ">=", "<="):
-            raise ExpressionError(f"Unexpected operator '{token}' where value expected")
+    while operators:
+        op = operators.pop()
+        if op == "(":
+            raise ExpressionError("Expected ')' to close parenthesized expression")
+        reduce(op)
 
-        # Bare identifier / number / boolean literal
-        self._consume()
-        return token
+    return _as_expr(operands[0])
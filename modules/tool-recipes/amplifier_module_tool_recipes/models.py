@@ -1,11 +1,62 @@
 """Recipe data models and YAML parsing."""
 
+import copy
+import re
 from dataclasses import dataclass, field
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any, Literal
 
 import yaml
 
+# Prefer the LibYAML-backed loader (C scanner/parser); fall back to the
+# pure-Python one when PyYAML was built without LibYAML.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+# Top-level context keys owned by the executor; steps may not write to them
+# (output, output_exit_code, update_context keys).
+_RESERVED_VARIABLE_NAMES: frozenset[str] = frozenset({"recipe", "session", "step"})
+
+# Accepted Step.on_error values and retry backoff strategies.
+_VALID_ON_ERROR: frozenset[str] = frozenset({"fail", "continue", "skip_remaining"})
+_VALID_RETRY_BACKOFF: frozenset[str] = frozenset({"exponential", "linear"})
+
+# A plain MAJOR.MINOR.PATCH version: the common case Recipe.validate() accepts
+# without running its detailed per-rule version checks.
+_SIMPLE_SEMVER_RE = re.compile(r"[0-9]+\.[0-9]+\.[0-9]+")
+
+# YAML step keys stored under a different Step field name, as (yaml_key, field):
+# - 'as' is a Python keyword.
+# - step-level 'context' is the context passed to a sub-recipe.
+# - 'steps' holds the nested body of a foreach/while compound step; it is kept
+#   as raw dicts in 'while_steps' and parsed on the fly by the executor.
+# Other keys map to Step fields one-to-one, so unknown keys still fail loudly.
+_STEP_KEY_ALIASES: tuple[tuple[str, str], ...] = (
+    ("as", "as_var"),
+    ("context", "step_context"),
+    ("steps", "while_steps"),
+)
+
+# Recipes parsed by Recipe.from_yaml(), keyed by resolved path and stored as
+# (st_mtime_ns, st_size, recipe).  One entry per file: an edited file replaces
+# its stale entry on the next load.
+_recipe_cache: dict[Path, tuple[int, int, "Recipe"]] = {}
+
+
+def _find_duplicates(names: Iterable[str]) -> list[str]:
+    """Return names that occur more than once, each listed once in first-repeat order."""
+    seen: set[str] = set()
+    duplicates: dict[str, None] = {}
+    for name in names:
+        if name in seen:
+            duplicates[name] = None
+        else:
+            seen.add(name)
+    return list(duplicates)
+
 
 @dataclass
 class RecursionConfig:
@@ -171,11 +222,10 @@ class Stage:
                 errors.append(f"Stage '{self.name}': {err}")
 
         # Check step ID uniqueness within stage
-        step_ids = [step.id for step in self.steps]
-        duplicates = [sid for sid in step_ids if step_ids.count(sid) > 1]
+        duplicates = _find_duplicates(step.id for step in self.steps)
         if duplicates:
             errors.append(
-                f"Stage '{self.name}': duplicate step IDs: {', '.join(set(duplicates))}"
+                f"Stage '{self.name}': duplicate step IDs: {', '.join(duplicates)}"
             )
 
         # Validate approval config if present
@@ -214,7 +264,7 @@ class ProviderPreferenceConfig:
         return errors
 
 
-@dataclass
+@dataclass(slots=True)
 class Step:
     """Represents a single step in a recipe workflow.
 
@@ -240,6 +290,7 @@ class Step:
 
     # Bash step fields (required when type="bash")
     command: str | None = None  # Shell command to execute
+    commands: list[str] | None = None  # Commands run in one shared shell session
     cwd: str | None = None  # Working directory (supports {{variable}} substitution)
     env: dict[str, str] | None = (
         None  # Environment variables (values support {{variable}})
@@ -255,7 +306,7 @@ class Step:
     parallel: bool | int = False  # False=sequential, True=unbounded, int=max concurrent
     checkpoint_iterations: bool = False  # Save progress after each foreach iteration for resumability
     max_iterations: int = 100
-    timeout: int = 600
+    timeout: float = 600  # Seconds; fractional values allowed
     retry: dict[str, Any] | None = None
     on_error: str = "fail"
     depends_on: list[str] = field(default_factory=list)
@@ -302,17 +353,20 @@ class Step:
         if not self.id:
             errors.append("Step missing required field: id")
 
-        # Compound container steps (foreach/while with nested sub-steps)
-        # don't need agent/prompt — the sub-steps carry those.
-        is_compound = bool(self.while_steps and (self.foreach or self.while_condition))
-
         # Type-specific validation
         if self.type == "agent":
-            # Agent steps require agent and prompt (unless compound container)
-            if not is_compound and not self.agent:
-                errors.append(f"Step '{self.id}': agent steps require 'agent' field")
-            if not is_compound and not self.prompt:
-                errors.append(f"Step '{self.id}': agent steps require 'prompt' field")
+            # Agent steps require agent and prompt, except compound container
+            # steps (foreach/while with nested sub-steps) whose sub-steps
+            # carry those.
+            if not (self.while_steps and (self.foreach or self.while_condition)):
+                if not self.agent:
+                    errors.append(
+                        f"Step '{self.id}': agent steps require 'agent' field"
+                    )
+                if not self.prompt:
+                    errors.append(
+                        f"Step '{self.id}': agent steps require 'prompt' field"
+                    )
             # Agent steps cannot have recipe-specific fields
             if self.recipe:
                 errors.append(
@@ -327,6 +381,10 @@ class Step:
                 errors.append(
                     f"Step '{self.id}': agent steps cannot have 'command' field"
                 )
+            if self.commands:
+                errors.append(
+                    f"Step '{self.id}': agent steps cannot have 'commands' field"
+                )
             # Validate spawn_mode value
             if self.spawn_mode is not None and self.spawn_mode != "subprocess":
                 errors.append(
@@ -360,13 +418,34 @@ class Step:
                 errors.append(
                     f"Step '{self.id}': recipe steps cannot have 'command' field"
                 )
+            if self.commands:
+                errors.append(
+                    f"Step '{self.id}': recipe steps cannot have 'commands' field"
+                )
             # Validate recursion config if present
             if self.recursion:
                 errors.extend(self.recursion.validate())
         elif self.type == "bash":
-            # Bash steps require command
-            if not self.command:
-                errors.append(f"Step '{self.id}': bash steps require 'command' field")
+            # Bash steps require command (or a batch of commands)
+            if self.commands is not None:
+                if self.command:
+                    errors.append(
+                        f"Step '{self.id}': bash steps cannot have both 'command' and 'commands' fields"
+                    )
+                if not isinstance(self.commands, list) or not self.commands:
+                    errors.append(
+                        f"Step '{self.id}': bash 'commands' must be a non-empty list"
+                    )
+                elif any(
+                    not isinstance(cmd, str) or not cmd.strip() for cmd in self.commands
+                ):
+                    errors.append(
+                        f"Step '{self.id}': bash commands cannot be empty or whitespace"
+                    )
+            elif not self.command:
+                errors.append(
+                    f"Step '{self.id}': bash steps require 'command' or 'commands' field"
+                )
             elif not self.command.strip():
                 errors.append(
                     f"Step '{self.id}': bash command cannot be empty or whitespace"
@@ -408,7 +487,7 @@ class Step:
                     errors.append(
                         f"Step '{self.id}': output_exit_code must be alphanumeric with underscores"
                     )
-                if self.output_exit_code in ("recipe", "session", "step"):
+                if self.output_exit_code in _RESERVED_VARIABLE_NAMES:
                     errors.append(
                         f"Step '{self.id}': output_exit_code '{self.output_exit_code}' is reserved"
                     )
@@ -421,7 +500,7 @@ class Step:
         if self.timeout <= 0:
             errors.append(f"Step '{self.id}': timeout must be positive")
 
-        if self.on_error not in ("fail", "continue", "skip_remaining"):
+        if self.on_error not in _VALID_ON_ERROR:
             errors.append(
                 f"Step '{self.id}': on_error must be 'fail', 'continue', or 'skip_remaining'"
             )
@@ -432,7 +511,7 @@ class Step:
                 errors.append(
                     f"Step '{self.id}': output name must be alphanumeric with underscores"
                 )
-            if self.output in ("recipe", "session", "step"):
+            if self.output in _RESERVED_VARIABLE_NAMES:
                 errors.append(
                     f"Step '{self.id}': output name '{self.output}' is reserved"
                 )
@@ -451,7 +530,7 @@ class Step:
                     )
 
                 backoff = self.retry.get("backoff", "exponential")
-                if backoff not in ("exponential", "linear"):
+                if backoff not in _VALID_RETRY_BACKOFF:
                     errors.append(
                         f"Step '{self.id}': retry.backoff must be 'exponential' or 'linear'"
                     )
@@ -493,13 +572,12 @@ class Step:
                 f"Step '{self.id}': 'break_when' requires 'foreach' or 'while_condition'"
             )
         if self.update_context:
-            reserved_keys = {"recipe", "session", "step"}
             for key in self.update_context:
                 if not key.replace("_", "").isalnum():
                     errors.append(
                         f"Step '{self.id}': update_context key '{key}' must be a valid identifier"
                     )
-                if key in reserved_keys:
+                if key in _RESERVED_VARIABLE_NAMES:
                     errors.append(
                         f"Step '{self.id}': update_context key '{key}' is reserved"
                     )
@@ -585,7 +663,7 @@ class Step:
         return errors
 
 
-@dataclass
+@dataclass(slots=True)
 class Recipe:
     """Represents a complete recipe specification.
 
@@ -634,20 +712,10 @@ class Recipe:
 
         step_data_copy = dict(step_data)
 
-        # Map 'as' to 'as_var' since 'as' is Python reserved keyword
-        if "as" in step_data_copy:
-            step_data_copy["as_var"] = step_data_copy.pop("as")
-
-        # Map 'context' to 'step_context' (context at step level is for sub-recipes)
-        if "context" in step_data_copy:
-            step_data_copy["step_context"] = step_data_copy.pop("context")
-
-        # Map 'steps' to 'while_steps' for compound steps (foreach or while bodies).
-        # In YAML, 'steps' is the natural key for nested step bodies in both
-        # foreach and while_condition blocks. Internally we store them as
-        # 'while_steps' (list of raw dicts parsed on-the-fly by the executor).
-        if "steps" in step_data_copy:
-            step_data_copy["while_steps"] = step_data_copy.pop("steps")
+        # Rename YAML keys that differ from Step field names
+        for yaml_key, field_name in _STEP_KEY_ALIASES:
+            if yaml_key in step_data_copy:
+                step_data_copy[field_name] = step_data_copy.pop(yaml_key)
 
         # Parse step-level recursion config if present
         if "recursion" in step_data_copy and isinstance(
@@ -709,13 +777,44 @@ class Recipe:
 
     @classmethod
     def from_yaml(cls, path: Path) -> "Recipe":
-        """Load recipe from YAML file."""
+        """Load recipe from YAML file.
+
+        Parsed recipes are cached per file and reused while the file's mtime and
+        size are unchanged. Each call returns an independent deep copy.
+        """
         if not path.exists():
             raise FileNotFoundError(f"Recipe file not found: {path}")
 
+        resolved = path.resolve()
+        stat = resolved.stat()
+        cached = _recipe_cache.get(resolved)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return copy.deepcopy(cached[2])
+
+        recipe = cls._load_yaml(resolved)
+        _recipe_cache[resolved] = (stat.st_mtime_ns, stat.st_size, recipe)
+        return copy.deepcopy(recipe)
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all recipes cached by from_yaml()."""
+        _recipe_cache.clear()
+
+    @classmethod
+    def _load_yaml(cls, path: Path) -> "Recipe":
+        """Read and parse a recipe YAML file, bypassing the cache."""
         with open(path, encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YamlLoader)
+        return cls._parse_dict(data)
 
+    @classmethod
+    def from_yaml_string(cls, text: str) -> "Recipe":
+        """Parse a recipe from YAML text (not cached)."""
+        return cls._parse_dict(yaml.load(text, Loader=_YamlLoader))
+
+    @classmethod
+    def _parse_dict(cls, data: Any) -> "Recipe":
+        """Build a recipe from loaded YAML data."""
         if not isinstance(data, dict):
             raise ValueError("Recipe YAML must be a dictionary")
 
@@ -801,7 +900,7 @@ class Recipe:
             errors.append("Recipe name must be alphanumeric with hyphens/underscores")
 
         # Version format (strict semver check - MAJOR.MINOR.PATCH only)
-        if self.version:
+        if self.version and not _SIMPLE_SEMVER_RE.fullmatch(self.version):
             # Check for v prefix (not allowed)
             if self.version.startswith("v"):
                 errors.append(
@@ -857,13 +956,12 @@ class Recipe:
             errors.extend(step_errors)
 
         # Check step ID uniqueness
-        step_ids = [step.id for step in self.steps]
-        duplicates = [sid for sid in step_ids if step_ids.count(sid) > 1]
+        duplicates = _find_duplicates(step.id for step in self.steps)
         if duplicates:
-            errors.append(f"Duplicate step IDs: {', '.join(set(duplicates))}")
+            errors.append(f"Duplicate step IDs: {', '.join(duplicates)}")
 
         # Validate depends_on references
-        step_id_set = set(step_ids)
+        step_id_set = {step.id for step in self.steps}
         for step in self.steps:
             for dep_id in step.depends_on:
                 if dep_id not in step_id_set:
@@ -883,10 +981,9 @@ class Recipe:
         errors = []
 
         # Check stage name uniqueness
-        stage_names = [stage.name for stage in self.stages]
-        duplicates = [name for name in stage_names if stage_names.count(name) > 1]
+        duplicates = _find_duplicates(stage.name for stage in self.stages)
         if duplicates:
-            errors.append(f"Duplicate stage names: {', '.join(set(duplicates))}")
+            errors.append(f"Duplicate stage names: {', '.join(duplicates)}")
 
         # Validate each stage
         for stage in self.stages:
@@ -894,14 +991,12 @@ class Recipe:
             errors.extend(stage_errors)
 
         # Check step ID uniqueness across all stages
-        all_step_ids = []
-        for stage in self.stages:
-            all_step_ids.extend([step.id for step in stage.steps])
+        all_step_ids = [step.id for stage in self.stages for step in stage.steps]
 
-        step_duplicates = [sid for sid in all_step_ids if all_step_ids.count(sid) > 1]
+        step_duplicates = _find_duplicates(all_step_ids)
         if step_duplicates:
             errors.append(
-                f"Duplicate step IDs across stages: {', '.join(set(step_duplicates))}"
+                f"Duplicate step IDs across stages: {', '.join(step_duplicates)}"
             )
 
         # Validate depends_on references across all stages
@@ -263,7 +263,7 @@ def _step_type_key(step: dict) -> str:
     """Return a canonical type key for a step dict.
 
     Recognised keys (in priority order): ``type`` field, presence of
-    ``command`` key, presence of ``recipe`` key.  Defaults to ``"agent"``.
+    ``command``/``commands`` key, presence of ``recipe`` key.  Defaults to ``"agent"``.
 
     Args:
         step: A step dictionary as parsed from the recipe YAML.
@@ -272,7 +272,7 @@ def _step_type_key(step: dict) -> str:
         One of: ``"bash"``, ``"recipe"``, ``"agent"``.
     """
     t = (step.get("type") or "").lower()
-    if t == "bash" or (not t and "command" in step):
+    if t == "bash" or (not t and ("command" in step or "commands" in step)):
         return "bash"
     if t == "recipe" or (not t and "recipe" in step):
         return "recipe"
@@ -211,8 +211,9 @@ def check_variable_references(recipe: Recipe) -> list[str]:
                     errors.append(err)
 
         # Command (bash steps)
-        if step.command:
-            for var in extract_variables(step.command):
+        step_commands = [step.command] if step.command else (step.commands or [])
+        for command in step_commands:
+            for var in extract_variables(command):
                 err = _check_var_ref(
                     var,
                     step.id,
@@ -356,27 +357,29 @@ def check_step_dependencies(recipe: Recipe) -> list[str]:
     errors = []
 
     all_steps = recipe.get_all_steps()
-    step_ids = {step.id for step in all_steps}
+    # Position of the first step with each ID (what get_step() would return).
+    # Requiring every dependency to appear earlier also rules out cycles.
+    step_index: dict[str, int] = {}
+    for i, step in enumerate(all_steps):
+        step_index.setdefault(step.id, i)
 
     # Check each step's dependencies
     for i, step in enumerate(all_steps):
         for dep_id in step.depends_on:
             # Check dependency exists
-            if dep_id not in step_ids:
+            dep_index = step_index.get(dep_id)
+            if dep_index is None:
                 errors.append(
                     f"Step '{step.id}': depends_on references unknown step '{dep_id}'"
                 )
                 continue
 
             # Check dependency appears before this step
-            dep_step = recipe.get_step(dep_id)
-            if dep_step:
-                dep_index = all_steps.index(dep_step)
-                if dep_index >= i:
-                    errors.append(
-                        f"Step '{step.id}': depends_on '{dep_id}' but '{dep_id}' "
-                        f"appears later in recipe (index {dep_index} >= {i})"
-                    )
+            if dep_index >= i:
+                errors.append(
+                    f"Step '{step.id}': depends_on '{dep_id}' but '{dep_id}' "
+                    f"appears later in recipe (index {dep_index} >= {i})"
+                )
 
         # Check for circular dependencies (simplified check)
         if step.id in step.depends_on:
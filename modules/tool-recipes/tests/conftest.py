@@ -1,9 +1,14 @@
 """Pytest fixtures for tool-recipes tests."""
 
+import asyncio
+import os
 import sys
 import tempfile
 import types
+from dataclasses import dataclass
+from dataclasses import field
 from pathlib import Path
+from typing import Any
 from unittest.mock import MagicMock
 
 import pytest
@@ -13,6 +18,15 @@ from amplifier_module_tool_recipes.models import Recipe
 from amplifier_module_tool_recipes.models import Step
 from amplifier_module_tool_recipes.session import SessionManager
 
+# Opt-in: AMPLIFIER_TEST_UVLOOP=1 runs async tests on uvloop (which must be
+# installed) instead of the default asyncio loop, e.g. to check bash step
+# subprocess handling on both loops.  Off by default so results do not depend
+# on what happens to be installed.
+if os.environ.get("AMPLIFIER_TEST_UVLOOP") == "1":
+    import uvloop
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
 # Module mocking is handled per-test-module via autouse fixture
 # to avoid polluting sys.modules for other test directories
 
@@ -162,6 +176,41 @@ class MockCoordinator:
         return self._available_agents
 
 
+@dataclass(slots=True)
+class FakeCoordinator:
+    """Plain-attribute stand-in for the Amplifier coordinator used by RecipeExecutor.
+
+    Cheaper than a MagicMock for tests that run whole recipes: every attribute
+    the executor touches is a real value, and only 'session.spawn' resolves to
+    a capability (returning spawn_output for every agent step).
+    """
+
+    hooks: Any = None
+    display_system: Any = None
+    cancellation: Any = None
+    session: Any = field(default_factory=object)
+    config: dict[str, Any] = field(default_factory=lambda: {"agents": {}})
+    spawn_output: str = "Mock agent result"
+
+    def get_capability(self, name: str) -> Any:
+        if name == "session.spawn":
+            return self._spawn
+        return None
+
+    async def _spawn(self, **kwargs: Any) -> dict[str, Any]:
+        return {"output": self.spawn_output}
+
+
+@pytest.fixture
+def fake_coordinator() -> type[FakeCoordinator]:
+    """Factory for FakeCoordinator instances.
+
+    Call it with the attributes a test needs, e.g.
+    ``fake_coordinator(hooks=registry, spawn_output="Mock result")``.
+    """
+    return FakeCoordinator
+
+
 @pytest.fixture
 def mock_coordinator() -> MockCoordinator:
     """Create a mock coordinator."""
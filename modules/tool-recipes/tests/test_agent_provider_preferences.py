@@ -1,6 +1,7 @@
 """Tests for agent-level provider_preferences fallback in recipe executor."""
 
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from amplifier_foundation.spawn_utils import ProviderPreference
@@ -352,3 +353,59 @@ class TestAgentProviderPreferencesFallback:
         assert len(prefs) == 1
         assert prefs[0].provider == "anthropic"
         assert prefs[0].model == "claude-sonnet-4-6"
+
+
+class TestModelResolutionCache:
+    """Tests for caching of resolve_model_pattern results in the executor."""
+
+    @pytest.fixture
+    def mock_resolve(self):
+        """Patch resolve_model_pattern with a counting AsyncMock."""
+        result = MagicMock()
+        result.resolved_model = "claude-sonnet-4-6"
+        with patch(
+            "amplifier_module_tool_recipes.executor.resolve_model_pattern",
+            new=AsyncMock(return_value=result),
+        ) as mock:
+            yield mock
+
+    async def test_repeated_pattern_resolved_once(
+        self, mock_resolve, mock_session_manager
+    ):
+        """Same (provider, pattern) is resolved by the provider only once."""
+        executor = RecipeExecutor(_make_coordinator(), mock_session_manager)
+
+        first = await executor._resolve_model("anthropic", "claude-sonnet-*")
+        second = await executor._resolve_model("anthropic", "claude-sonnet-*")
+
+        assert first == second == "claude-sonnet-4-6"
+        mock_resolve.assert_called_once()
+
+    async def test_concurrent_resolutions_share_one_lookup(
+        self, mock_resolve, mock_session_manager
+    ):
+        """Parallel resolutions of the same key trigger a single lookup."""
+        executor = RecipeExecutor(_make_coordinator(), mock_session_manager)
+
+        results = await asyncio.gather(
+            *(executor._resolve_model("anthropic", "claude-sonnet-*") for _ in range(10))
+        )
+
+        assert set(results) == {"claude-sonnet-4-6"}
+        mock_resolve.assert_called_once()
+
+    async def test_distinct_keys_and_expired_entries_resolve_again(
+        self, mock_resolve, mock_session_manager, monkeypatch
+    ):
+        """Different providers are cached separately; stale entries are refreshed."""
+        executor = RecipeExecutor(_make_coordinator(), mock_session_manager)
+
+        await executor._resolve_model("anthropic", "claude-sonnet-*")
+        await executor._resolve_model("openai", "claude-sonnet-*")
+        assert mock_resolve.call_count == 2
+
+        monkeypatch.setattr(
+            "amplifier_module_tool_recipes.executor._MODEL_RESOLUTION_TTL_SECONDS", 0.0
+        )
+        await executor._resolve_model("anthropic", "claude-sonnet-*")
+        assert mock_resolve.call_count == 3
@@ -1,5 +1,6 @@
 """Tests for bash step type - direct shell execution without LLM overhead."""
 
+import asyncio
 import os
 from pathlib import Path
 
@@ -27,6 +28,16 @@ class MockCoordinator:
         self.calls = []
 
 
+@pytest.fixture(scope="module")
+def executor() -> RecipeExecutor:
+    """Executor shared by the module's bash execution tests.
+
+    _execute_bash_step keeps no per-run state on the executor, so one instance
+    serves every test.
+    """
+    return RecipeExecutor(MockCoordinator(), MockSessionManager())  # type: ignore[arg-type]
+
+
 class TestBashStepModel:
     """Tests for bash step model validation."""
 
@@ -83,39 +94,21 @@ class TestBashStepModel:
         errors = step.validate()
         assert any("whitespace" in e.lower() for e in errors)
 
-    def test_bash_step_cannot_have_agent(self):
-        """Bash step cannot have agent field."""
-        step = Step(id="test", type="bash", command="echo hello", agent="some-agent")
-        errors = step.validate()
-        assert any("agent" in e.lower() for e in errors)
-
-    def test_bash_step_cannot_have_prompt(self):
-        """Bash step cannot have prompt field."""
-        step = Step(id="test", type="bash", command="echo hello", prompt="some prompt")
-        errors = step.validate()
-        assert any("prompt" in e.lower() for e in errors)
-
-    def test_bash_step_cannot_have_mode(self):
-        """Bash step cannot have mode field."""
-        step = Step(id="test", type="bash", command="echo hello", mode="ANALYZE")
-        errors = step.validate()
-        assert any("mode" in e.lower() for e in errors)
-
-    def test_bash_step_cannot_have_agent_config(self):
-        """Bash step cannot have agent_config field."""
-        step = Step(
-            id="test", type="bash", command="echo hello", agent_config={"key": "value"}
-        )
+    @pytest.mark.parametrize(
+        "field,value",
+        [
+            ("agent", "some-agent"),
+            ("prompt", "some prompt"),
+            ("mode", "ANALYZE"),
+            ("agent_config", {"key": "value"}),
+            ("recipe", "some-recipe.yaml"),
+        ],
+    )
+    def test_bash_step_cannot_have_field(self, field: str, value: object):
+        """Bash step cannot have agent- or recipe-specific fields."""
+        step = Step(id="test", type="bash", command="echo hello", **{field: value})
         errors = step.validate()
-        assert any("agent_config" in e.lower() for e in errors)
-
-    def test_bash_step_cannot_have_recipe(self):
-        """Bash step cannot have recipe field."""
-        step = Step(
-            id="test", type="bash", command="echo hello", recipe="some-recipe.yaml"
-        )
-        errors = step.validate()
-        assert any("recipe" in e.lower() for e in errors)
+        assert any(f"'{field}'" in e for e in errors)
 
     def test_bash_step_output_exit_code_validation(self):
         """output_exit_code must be valid variable name."""
@@ -145,21 +138,41 @@ class TestBashStepModel:
             errors = step.validate()
             assert any("reserved" in e.lower() for e in errors)
 
+    def test_bash_step_with_commands_valid(self):
+        """Bash step may use a commands list instead of command."""
+        step = Step(id="test", type="bash", commands=["echo a", "echo b"])
+        assert step.validate() == []
+
+    def test_bash_step_cannot_have_command_and_commands(self):
+        """Bash step cannot combine command with commands."""
+        step = Step(id="test", type="bash", command="echo a", commands=["echo b"])
+        errors = step.validate()
+        assert any("both" in e.lower() for e in errors)
+
+    def test_bash_step_commands_cannot_be_empty(self):
+        """Empty commands list or blank entries should fail validation."""
+        assert Step(id="test", type="bash", commands=[]).validate()
+        assert Step(id="test", type="bash", commands=["echo a", "  "]).validate()
+
+    def test_agent_step_cannot_have_commands(self):
+        """Agent step cannot have commands field."""
+        step = Step(id="test", agent="a", prompt="p", commands=["echo a"])
+        errors = step.validate()
+        assert any("commands" in e.lower() for e in errors)
+
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestBashStepExecution:
-    """Tests for bash step execution."""
+    """Tests for bash step execution.
 
-    @pytest.fixture
-    def executor(self) -> RecipeExecutor:
-        """Create executor with mock dependencies."""
-        return RecipeExecutor(MockCoordinator(), MockSessionManager())  # type: ignore[arg-type]
+    The tests share one module-scoped event loop instead of a loop per test.
+    """
 
     @pytest.fixture
     def project_path(self, tmp_path: Path) -> Path:
         """Create a temporary project directory."""
         return tmp_path
 
-    @pytest.mark.asyncio
     async def test_execute_simple_command(
         self, executor: RecipeExecutor, project_path: Path
     ):
@@ -173,7 +186,6 @@ class TestBashStepExecution:
         assert result.stdout.strip() == "hello"
         assert result.exit_code == 0
 
-    @pytest.mark.asyncio
     async def test_execute_with_variable_substitution(
         self, executor: RecipeExecutor, project_path: Path
     ):
@@ -185,7 +197,6 @@ class TestBashStepExecution:
 
         assert result.stdout.strip() == "world"
 
-    @pytest.mark.asyncio
     async def test_execute_with_env_variables(
         self, executor: RecipeExecutor, project_path: Path
     ):
@@ -199,7 +210,6 @@ class TestBashStepExecution:
 
         assert result.stdout.strip() == "from_env"
 
-    @pytest.mark.asyncio
     async def test_execute_with_env_variable_substitution(
         self, executor: RecipeExecutor, project_path: Path
     ):
@@ -213,7 +223,6 @@ class TestBashStepExecution:
 
         assert result.stdout.strip() == "substituted"
 
-    @pytest.mark.asyncio
     async def test_execute_with_cwd(self, executor: RecipeExecutor, project_path: Path):
         """Command should run in specified working directory."""
         subdir = project_path / "subdir"
@@ -226,7 +235,6 @@ class TestBashStepExecution:
 
         assert result.stdout.strip() == str(subdir)
 
-    @pytest.mark.asyncio
     async def test_execute_with_cwd_variable_substitution(
         self, executor: RecipeExecutor, project_path: Path
     ):
@@ -241,7 +249,6 @@ class TestBashStepExecution:
 
         assert result.stdout.strip() == str(subdir)
 
-    @pytest.mark.asyncio
     async def test_execute_with_relative_cwd(
         self, executor: RecipeExecutor, project_path: Path
     ):
@@ -256,7 +263,6 @@ class TestBashStepExecution:
 
         assert result.stdout.strip() == str(subdir)
 
-    @pytest.mark.asyncio
     async def test_execute_nonexistent_cwd_fails(
         self, executor: RecipeExecutor, project_path: Path
     ):
@@ -269,7 +275,6 @@ class TestBashStepExecution:
 
         assert "cwd does not exist" in str(exc_info.value)
 
-    @pytest.mark.asyncio
     async def test_execute_nonzero_exit_code(
         self, executor: RecipeExecutor, project_path: Path
     ):
@@ -282,7 +287,6 @@ class TestBashStepExecution:
 
         assert "exit code 1" in str(exc_info.value)
 
-    @pytest.mark.asyncio
     async def test_execute_nonzero_exit_code_continue(
         self, executor: RecipeExecutor, project_path: Path
     ):
@@ -294,7 +298,6 @@ class TestBashStepExecution:
 
         assert result.exit_code == 42
 
-    @pytest.mark.asyncio
     async def test_execute_captures_stderr(
         self, executor: RecipeExecutor, project_path: Path
     ):
@@ -308,10 +311,9 @@ class TestBashStepExecution:
 
         assert result.stderr.strip() == "error"
 
-    @pytest.mark.asyncio
     async def test_execute_timeout(self, executor: RecipeExecutor, project_path: Path):
         """Command exceeding timeout should be killed."""
-        step = Step(id="test", type="bash", command="sleep 10", timeout=1)
+        step = Step(id="test", type="bash", command="sleep 5", timeout=0.1)
         context: dict = {}
 
         with pytest.raises(ValueError) as exc_info:
@@ -319,7 +321,6 @@ class TestBashStepExecution:
 
         assert "timed out" in str(exc_info.value)
 
-    @pytest.mark.asyncio
     async def test_execute_multiline_command(
         self, executor: RecipeExecutor, project_path: Path
     ):
@@ -339,7 +340,6 @@ class TestBashStepExecution:
 
         assert result.stdout.strip() == "3"
 
-    @pytest.mark.asyncio
     async def test_execute_pipe_command(
         self, executor: RecipeExecutor, project_path: Path
     ):
@@ -351,24 +351,36 @@ class TestBashStepExecution:
 
         assert result.stdout.strip() == "3"
 
-    @pytest.mark.asyncio
-    async def test_execute_inherits_environment(
+    async def test_execute_decodes_utf8_split_across_reads(
         self, executor: RecipeExecutor, project_path: Path
+    ):
+        """Multi-byte characters split across pipe reads decode intact."""
+        step = Step(
+            id="test",
+            type="bash",
+            command=r"printf '\xc3'; sleep 0.05; printf '\xa9 \xff\n'",
+        )
+
+        result = await executor._execute_bash_step(step, {}, project_path)
+
+        assert result.stdout == "\u00e9 \ufffd\n"
+
+    async def test_execute_inherits_environment(
+        self,
+        executor: RecipeExecutor,
+        project_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
     ):
         """Command should inherit parent environment."""
         # Set a unique env var to test inheritance
-        os.environ["TEST_BASH_STEP_VAR"] = "inherited"
-        try:
-            step = Step(id="test", type="bash", command="echo $TEST_BASH_STEP_VAR")
-            context: dict = {}
+        monkeypatch.setenv("TEST_BASH_STEP_VAR", "inherited")
+        step = Step(id="test", type="bash", command="echo $TEST_BASH_STEP_VAR")
+        context: dict = {}
 
-            result = await executor._execute_bash_step(step, context, project_path)
+        result = await executor._execute_bash_step(step, context, project_path)
 
-            assert result.stdout.strip() == "inherited"
-        finally:
-            del os.environ["TEST_BASH_STEP_VAR"]
+        assert result.stdout.strip() == "inherited"
 
-    @pytest.mark.asyncio
     async def test_execute_injects_amplifier_python(
         self, executor: RecipeExecutor, project_path: Path
     ):
@@ -384,7 +396,6 @@ class TestBashStepExecution:
             f"AMPLIFIER_PYTHON should point to a Python executable, got: {amplifier_python}"
         )
 
-    @pytest.mark.asyncio
     async def test_amplifier_python_is_current_interpreter(
         self, executor: RecipeExecutor, project_path: Path
     ):
@@ -398,7 +409,6 @@ class TestBashStepExecution:
 
         assert result.stdout.strip() == sys.executable
 
-    @pytest.mark.asyncio
     async def test_amplifier_python_not_overridden_by_step_env(
         self, executor: RecipeExecutor, project_path: Path
     ):
@@ -416,11 +426,260 @@ class TestBashStepExecution:
         # Step env overrides the injected value (step env is applied after injection)
         assert result.stdout.strip() == "/custom/python"
 
+    async def test_execute_concurrent_steps(
+        self, executor: RecipeExecutor, project_path: Path
+    ):
+        """Independent bash steps can run concurrently on one executor."""
+        steps = [
+            Step(id=f"s{i}", type="bash", command="echo {{i}}") for i in range(16)
+        ]
+
+        results = await asyncio.gather(
+            *(
+                executor._execute_bash_step(step, {"i": i}, project_path)
+                for i, step in enumerate(steps)
+            )
+        )
+
+        assert [r.stdout.strip() for r in results] == [str(i) for i in range(16)]
+
+
+class FakeShell:
+    """In-process CommandRunner that records calls instead of spawning bash."""
+
+    def __init__(self, result: BashResult | None = None, delay: float = 0.0):
+        self.result = result or BashResult(stdout="", stderr="", exit_code=0)
+        self.delay = delay
+        self.calls: list[tuple[str, Path, dict[str, str], float]] = []
+
+    async def __call__(
+        self, command: str, cwd: Path, env: dict[str, str], timeout: float
+    ) -> BashResult:
+        self.calls.append((command, cwd, env, timeout))
+        if self.delay > timeout:
+            raise asyncio.TimeoutError
+        return self.result
+
+
+class TestBashCommandRunner:
+    """Tests for the executor's injectable bash command runner."""
+
+    @pytest.mark.asyncio
+    async def test_runner_receives_resolved_inputs(self, tmp_path: Path):
+        """Runner gets the substituted command, resolved cwd, env and timeout."""
+        (tmp_path / "work").mkdir()
+        shell = FakeShell(BashResult(stdout="ok\n", stderr="", exit_code=0))
+        executor = RecipeExecutor(
+            MockCoordinator(),
+            MockSessionManager(),  # type: ignore[arg-type]
+            command_runner=shell,
+        )
+        step = Step(
+            id="test",
+            type="bash",
+            command="echo {{name}}",
+            cwd="work",
+            env={"GREETING": "hi {{name}}"},
+            timeout=5,
+        )
+
+        result = await executor._execute_bash_step(step, {"name": "bob"}, tmp_path)
+
+        assert result.stdout == "ok\n"
+        [(command, cwd, env, timeout)] = shell.calls
+        assert command == "echo bob"
+        assert cwd == tmp_path / "work"
+        assert env["GREETING"] == "hi bob"
+        assert "AMPLIFIER_PYTHON" in env
+        assert timeout == 5
+
+    @pytest.mark.asyncio
+    async def test_runner_nonzero_exit_code_fails_step(self, tmp_path: Path):
+        """Runner exit codes go through the step's on_error handling."""
+        shell = FakeShell(BashResult(stdout="", stderr="boom", exit_code=2))
+        executor = RecipeExecutor(
+            MockCoordinator(),
+            MockSessionManager(),  # type: ignore[arg-type]
+            command_runner=shell,
+        )
+        step = Step(id="test", type="bash", command="anything")
+
+        with pytest.raises(ValueError, match="exit code 2\nstderr: boom"):
+            await executor._execute_bash_step(step, {}, tmp_path)
+
+    @pytest.mark.asyncio
+    async def test_runner_timeout_is_reported(self, tmp_path: Path):
+        """A runner timeout surfaces as the step's timed-out error."""
+        executor = RecipeExecutor(
+            MockCoordinator(),
+            MockSessionManager(),  # type: ignore[arg-type]
+            command_runner=FakeShell(delay=10),
+        )
+        step = Step(id="test", type="bash", command="anything", timeout=1)
+
+        with pytest.raises(ValueError, match="timed out after 1s"):
+            await executor._execute_bash_step(step, {}, tmp_path)
+
+
+    @pytest.mark.asyncio
+    async def test_batch_steps_bypass_runner(self, tmp_path: Path):
+        """A commands batch runs in its own bash process, not through the runner."""
+        shell = FakeShell()
+        executor = RecipeExecutor(
+            MockCoordinator(),
+            MockSessionManager(),  # type: ignore[arg-type]
+            command_runner=shell,
+        )
+        step = Step(id="test", type="bash", commands=["echo a", "echo b"])
+
+        result = await executor._execute_bash_step(step, {}, tmp_path)
+
+        assert result.stdout == "a\nb\n"
+        assert shell.calls == []
+
+
+class TestBatchBashStepExecution:
+    """Tests for bash steps that batch several commands into one shell."""
+
+    @pytest.mark.asyncio
+    async def test_execute_commands_share_session(
+        self, executor: RecipeExecutor, tmp_path: Path
+    ):
+        """Commands run in one shell, so state carries over between them."""
+        (tmp_path / "sub").mkdir()
+        step = Step(
+            id="test",
+            type="bash",
+            commands=["X={{value}}", "echo $X", "cd sub", "pwd"],
+        )
+
+        result = await executor._execute_bash_step(step, {"value": "v"}, tmp_path)
+
+        assert result.stdout.splitlines() == ["v", str(tmp_path / "sub")]
+        assert result.exit_code == 0
+
+    @pytest.mark.asyncio
+    async def test_execute_commands_demultiplexes_stderr(
+        self, executor: RecipeExecutor, tmp_path: Path
+    ):
+        """Stderr of each command should be captured separately from stdout."""
+        step = Step(id="test", type="bash", commands=["echo out", "echo err >&2"])
+
+        result = await executor._execute_bash_step(step, {}, tmp_path)
+
+        assert result.stdout == "out\n"
+        assert result.stderr == "err\n"
+
+    @pytest.mark.asyncio
+    async def test_execute_commands_stops_at_first_failure(
+        self, executor: RecipeExecutor, tmp_path: Path
+    ):
+        """A failing command stops the batch and reports its exit code."""
+        step = Step(
+            id="test",
+            type="bash",
+            commands=["echo first", "false", "echo never"],
+            on_error="continue",
+        )
+
+        result = await executor._execute_bash_step(step, {}, tmp_path)
+
+        assert result.stdout == "first\n"
+        assert result.exit_code == 1
+
+    @pytest.mark.asyncio
+    async def test_execute_commands_shell_exit(
+        self, executor: RecipeExecutor, tmp_path: Path
+    ):
+        """An explicit exit ends the batch with that exit code."""
+        step = Step(id="test", type="bash", commands=["exit 3", "echo never"])
+
+        with pytest.raises(ValueError) as exc_info:
+            await executor._execute_bash_step(step, {}, tmp_path)
+
+        assert "exit code 3" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_execute_commands_syntax_error_fails_promptly(
+        self, executor: RecipeExecutor, tmp_path: Path
+    ):
+        """A command that does not parse fails with exit code 2, not a hang."""
+        step = Step(
+            id="test",
+            type="bash",
+            commands=['echo "oops', "echo after"],
+            timeout=5,
+            on_error="continue",
+        )
+
+        result = await asyncio.wait_for(
+            executor._execute_bash_step(step, {}, tmp_path), timeout=2
+        )
+
+        assert result.exit_code == 2
+        assert "after" not in result.stdout
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("command", ["cat <<EOF", "echo a \\"])
+    async def test_execute_commands_unterminated_input_matches_command(
+        self, executor: RecipeExecutor, tmp_path: Path, command: str
+    ):
+        """Unterminated heredocs and trailing backslashes end at the command.
+
+        They behave as they do in a single `command:` step, and the sentinels
+        that follow them are still seen.
+        """
+        single = Step(id="single", type="bash", command=command, timeout=5)
+        batch = Step(id="batch", type="bash", commands=[command], timeout=5)
+
+        expected = await executor._execute_bash_step(single, {}, tmp_path)
+        result = await asyncio.wait_for(
+            executor._execute_bash_step(batch, {}, tmp_path), timeout=2
+        )
+
+        assert result.stdout == expected.stdout
+        assert result.exit_code == expected.exit_code
+
+    @pytest.mark.asyncio
+    async def test_execute_commands_timeout(
+        self, executor: RecipeExecutor, tmp_path: Path
+    ):
+        """The step timeout bounds the whole batch."""
+        step = Step(id="test", type="bash", commands=["echo a", "sleep 5"], timeout=0.1)
+
+        with pytest.raises(ValueError) as exc_info:
+            await executor._execute_bash_step(step, {}, tmp_path)
+
+        assert "timed out" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_batch_kills_shell(
+        self, executor: RecipeExecutor, tmp_path: Path
+    ):
+        """Cancelling a running batch kills its shell instead of leaking it."""
+        pid_file = tmp_path / "shell.pid"
+        step = Step(
+            id="test",
+            type="bash",
+            commands=[f"echo $$ > {pid_file}; sleep 30"],
+            timeout=60,
+        )
+        task = asyncio.create_task(executor._execute_bash_step(step, {}, tmp_path))
+        while not pid_file.exists() or not pid_file.read_text().strip():
+            await asyncio.sleep(0.01)
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        with pytest.raises(ProcessLookupError):
+            os.kill(int(pid_file.read_text()), 0)
+
 
 class TestBashStepYamlParsing:
     """Tests for parsing bash steps from YAML."""
 
-    def test_parse_minimal_bash_step(self, tmp_path: Path):
+    def test_parse_minimal_bash_step(self):
         """Minimal bash step should parse correctly."""
         yaml_content = """
 name: test-recipe
@@ -432,15 +691,13 @@ steps:
     type: bash
     command: echo hello
 """
-        recipe_file = tmp_path / "recipe.yaml"
-        recipe_file.write_text(yaml_content)
-        recipe = Recipe.from_yaml(recipe_file)
+        recipe = Recipe.from_yaml_string(yaml_content)
         assert len(recipe.steps) == 1
         step = recipe.steps[0]
         assert step.type == "bash"
         assert step.command == "echo hello"
 
-    def test_parse_full_bash_step(self, tmp_path: Path):
+    def test_parse_full_bash_step(self):
         """Full bash step with all fields should parse correctly."""
         yaml_content = """
 name: test-recipe
@@ -460,9 +717,7 @@ steps:
     timeout: 30
     on_error: continue
 """
-        recipe_file = tmp_path / "recipe.yaml"
-        recipe_file.write_text(yaml_content)
-        recipe = Recipe.from_yaml(recipe_file)
+        recipe = Recipe.from_yaml_string(yaml_content)
         step = recipe.steps[0]
         assert step.type == "bash"
         assert step.command == "echo $VAR"
@@ -473,7 +728,27 @@ steps:
         assert step.timeout == 30
         assert step.on_error == "continue"
 
-    def test_parse_bash_step_with_variables(self, tmp_path: Path):
+    def test_parse_bash_step_with_commands(self):
+        """Bash step with a commands list should parse."""
+        yaml_content = """
+name: test-recipe
+description: Test bash steps
+version: "1.0.0"
+
+steps:
+  - id: batch
+    type: bash
+    commands:
+      - echo one
+      - echo two
+"""
+        recipe = Recipe.from_yaml_string(yaml_content)
+        step = recipe.steps[0]
+        assert step.command is None
+        assert step.commands == ["echo one", "echo two"]
+        assert recipe.validate() == []
+
+    def test_parse_bash_step_with_variables(self):
         """Bash step with variable references should parse."""
         yaml_content = """
 name: test-recipe
@@ -489,13 +764,11 @@ steps:
     command: curl {{api_url}}/data
     output: data
 """
-        recipe_file = tmp_path / "recipe.yaml"
-        recipe_file.write_text(yaml_content)
-        recipe = Recipe.from_yaml(recipe_file)
+        recipe = Recipe.from_yaml_string(yaml_content)
         step = recipe.steps[0]
         assert "{{api_url}}" in step.command
 
-    def test_parse_mixed_step_types(self, tmp_path: Path):
+    def test_parse_mixed_step_types(self):
         """Recipe with mixed step types should parse correctly."""
         yaml_content = """
 name: test-recipe
@@ -517,9 +790,7 @@ steps:
     agent: foundation:modular-builder
     prompt: Build based on {{processed}}
 """
-        recipe_file = tmp_path / "recipe.yaml"
-        recipe_file.write_text(yaml_content)
-        recipe = Recipe.from_yaml(recipe_file)
+        recipe = Recipe.from_yaml_string(yaml_content)
         assert len(recipe.steps) == 3
         assert recipe.steps[0].type == "agent"
         assert recipe.steps[1].type == "bash"
@@ -2,6 +2,10 @@
 
 import pytest
 from amplifier_module_tool_recipes.expression_evaluator import ExpressionError
+from amplifier_module_tool_recipes.expression_evaluator import _compile
+from amplifier_module_tool_recipes.expression_evaluator import _compile_simple_comparison
+from amplifier_module_tool_recipes.expression_evaluator import _parse
+from amplifier_module_tool_recipes.expression_evaluator import _tokenize
 from amplifier_module_tool_recipes.expression_evaluator import evaluate_condition
 
 
@@ -189,3 +193,133 @@ class TestRecipePatterns:
         ctx = {"anything": "whatever"}
         # Empty condition = always run
         assert evaluate_condition("", ctx) is True
+
+
+class TestCompiledExpressionCache:
+    """Tests for per-expression AST caching."""
+
+    def test_same_expression_different_contexts(self):
+        """Cached compiled form resolves variables against each new context."""
+        cond = "{{status}} == 'success'"
+        assert evaluate_condition(cond, {"status": "success"}) is True
+        assert evaluate_condition(cond, {"status": "failure"}) is False
+        assert evaluate_condition(cond, {"status": "success"}) is True
+
+    def test_repeat_evaluation_hits_cache(self):
+        """Re-evaluating an expression does not re-parse it."""
+        cond = "{{count}} > 3 and {{mode}} != 'dry-run'"
+        _compile.cache_clear()
+        evaluate_condition(cond, {"count": 5, "mode": "live"})
+        evaluate_condition(cond, {"count": 1, "mode": "live"})
+        info = _compile.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+    def test_undefined_variable_still_raises_after_caching(self):
+        """Variable lookup happens per evaluation, not at compile time."""
+        cond = "{{maybe}} == 'x'"
+        assert evaluate_condition(cond, {"maybe": "x"}) is True
+        with pytest.raises(ExpressionError, match="Undefined variable"):
+            evaluate_condition(cond, {})
+
+
+class TestSimpleComparisonFastPath:
+    """Tests for the single-comparison compile fast path."""
+
+    def test_fast_path_matches_parser(self):
+        """Fast path builds the same AST the general parser would."""
+        for cond in (
+            "{{status}} == 'success'",
+            '{{a.b}} != "x y"',
+            "{{count}}>=3",
+            "{{a}} == {{b}}",
+            "{{flag}} == TRUE",
+            "done < 10",
+        ):
+            node = _compile_simple_comparison(cond)
+            assert node is not None, cond
+            assert node == _parse(_tokenize(cond))
+
+    def test_other_shapes_fall_through(self):
+        """Compound, escaped or malformed expressions use the general parser."""
+        for cond in (
+            "{{a}} == 'x' and {{b}} == 'y'",
+            "{{a}} == 'it\\'s'",
+            "not == {{a}}",
+            "{{x}} >>> 'value'",
+        ):
+            assert _compile_simple_comparison(cond) is None, cond
+
+
+class TestNonStringVariableValues:
+    """Variable values are resolved at evaluation time, never re-tokenized.
+
+    Values whose text would not tokenize as an operand (negative numbers,
+    exponent floats, lists, dicts) compare through their str() form.
+    """
+
+    def test_negative_number(self):
+        """A negative number compares numerically."""
+        assert evaluate_condition("{{n}} < 0", {"n": -5}) is True
+        assert evaluate_condition("{{n}} > {{m}}", {"n": -5, "m": -10}) is True
+
+    def test_negative_number_string(self):
+        """A negative number held as a string also compares numerically."""
+        assert evaluate_condition("{{n}} < 0", {"n": "-5"}) is True
+
+    def test_exponent_float(self):
+        """A float whose str() uses an exponent still compares numerically."""
+        assert evaluate_condition("{{x}} < 0.001", {"x": 1e-05}) is True
+
+    def test_list_value(self):
+        """A list compares by its str() form."""
+        ctx = {"items": ["a", "b"]}
+        assert evaluate_condition("{{items}} == \"['a', 'b']\"", ctx) is True
+        assert evaluate_condition("{{items}} != ''", ctx) is True
+
+    def test_dict_value(self):
+        """A dict compares by its str() form."""
+        ctx = {"cfg": {"k": 1}}
+        assert evaluate_condition("{{cfg}} == \"{'k': 1}\"", ctx) is True
+
+    def test_empty_list_is_truthy(self):
+        """A bare list reference is truthy: '[]' is not one of the falsy strings."""
+        assert evaluate_condition("{{items}}", {"items": []}) is True
+
+    def test_syntax_error_reported_before_undefined_variable(self):
+        """Malformed expressions fail to compile before variables are resolved."""
+        with pytest.raises(ExpressionError, match="Invalid expression"):
+            evaluate_condition("{{missing}} ==", {})
+
+
+class TestAdjacentOperands:
+    """References written flush against other references or bare words form one operand."""
+
+    def test_version_components(self):
+        """Dotted version parts concatenate before comparing."""
+        ctx = {"major": 1, "minor": 3}
+        assert evaluate_condition("{{major}}.{{minor}} >= 1.2", ctx) is True
+        assert evaluate_condition("{{major}}.{{minor}} == '1.3'", ctx) is True
+
+    def test_reference_then_word(self):
+        """A bare word after a reference is appended to its value."""
+        assert evaluate_condition("{{n}}0 == 50", {"n": 5}) is True
+
+    def test_two_references(self):
+        """Two references written flush against each other concatenate."""
+        assert evaluate_condition("{{a}}{{b}} == 12", {"a": 1, "b": 2}) is True
+
+    def test_string_values(self):
+        """String values concatenate the same way as numbers."""
+        ctx = {"env": "prod", "region": "eu"}
+        assert evaluate_condition("{{env}}_{{region}} == 'prod_eu'", ctx) is True
+
+    def test_whitespace_separates_operands(self):
+        """Operands separated by whitespace are not joined."""
+        with pytest.raises(ExpressionError, match="Unexpected token"):
+            evaluate_condition("{{a}} {{b}} == 12", {"a": 1, "b": 2})
+
+    def test_keywords_never_join(self):
+        """Logical keywords stay operators even when written flush against a reference."""
+        assert evaluate_condition("not{{a}}", {"a": "false"}) is True
+        assert evaluate_condition("{{a}}and{{b}}", {"a": "x", "b": ""}) is False
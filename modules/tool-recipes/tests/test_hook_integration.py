@@ -6,6 +6,7 @@ events are properly emitted and can be observed by external systems.
 
 import asyncio
 from pathlib import Path
+from typing import Any
 from unittest.mock import MagicMock, AsyncMock
 
 import pytest
@@ -16,6 +17,23 @@ from amplifier_module_tool_recipes.models import Recipe
 from amplifier_module_tool_recipes.session import SessionManager
 
 
+@pytest.fixture(scope="module")
+def hooks_registry() -> HookRegistry:
+    """Create real HookRegistry instance shared by the module's tests."""
+    return HookRegistry()
+
+
+@pytest.fixture(scope="module")
+def session_manager(tmp_path_factory: pytest.TempPathFactory) -> SessionManager:
+    """Create SessionManager with temp directory.
+
+    Shared by the module's tests: every recipe run gets its own session ID.
+    """
+    sessions_dir = tmp_path_factory.mktemp("hooks") / ".amplifier" / "projects"
+    sessions_dir.mkdir(parents=True, exist_ok=True)
+    return SessionManager(base_dir=sessions_dir, auto_cleanup_days=7)
+
+
 class TestHookEventEmission:
     """Integration tests for hook event emission during recipe execution."""
 
@@ -26,51 +44,40 @@ class TestHookEventEmission:
         project.mkdir()
         return project
 
-    @pytest.fixture
-    def hooks_registry(self) -> HookRegistry:
-        """Create real HookRegistry instance."""
-        return HookRegistry()
-
-    @pytest.fixture
-    def session_manager(self, tmp_path: Path) -> SessionManager:
-        """Create SessionManager with temp directory."""
-        sessions_dir = tmp_path / ".amplifier" / "projects"
-        sessions_dir.mkdir(parents=True, exist_ok=True)
-        return SessionManager(base_dir=sessions_dir, auto_cleanup_days=7)
+    @pytest.fixture(autouse=True)
+    def reset_hooks_registry(self, hooks_registry: HookRegistry):
+        """Unregister handlers a test added to the shared registry."""
+        before = {
+            name for names in hooks_registry.list_handlers().values() for name in names
+        }
+        yield
+        for names in hooks_registry.list_handlers().values():
+            for name in names:
+                if name not in before:
+                    hooks_registry.unregister(name)
 
     @pytest.fixture
-    def coordinator(self, hooks_registry: HookRegistry) -> MagicMock:
-        """Create mock coordinator with real HookRegistry."""
-        coordinator = MagicMock()
-        coordinator.hooks = hooks_registry
-        coordinator.display_system = None  # No display needed for event tests
-        coordinator.cancellation = None  # Prevent MagicMock truthy cancellation
-
-        # Mock spawn capability for agent steps
-        async def mock_spawn(**kwargs):
-            """Mock spawn that returns simple result."""
-            return {"output": "Mock agent result"}
-
-        coordinator.get_capability = MagicMock(return_value=mock_spawn)
-        coordinator.session = MagicMock()
-        coordinator.config = {"agents": {}}
-
-        return coordinator
+    def coordinator(self, hooks_registry: HookRegistry, fake_coordinator) -> Any:
+        """Create fake coordinator with real HookRegistry."""
+        return fake_coordinator(hooks=hooks_registry)
 
     @pytest.mark.asyncio
     async def test_executor_emits_lifecycle_events(
         self,
-        coordinator: MagicMock,
+        coordinator: Any,
         session_manager: SessionManager,
         temp_project: Path,
     ):
         """Verify recipe executor emits all lifecycle events correctly."""
         # Capture events
         events_captured = []
+        completed = asyncio.Event()
 
         async def capture_event(event: str, data: dict) -> HookResult:
             """Hook handler that captures events."""
             events_captured.append((event, data))
+            if event == "recipe:complete":
+                completed.set()
             return HookResult(action="continue")
 
         # Register handlers for all recipe lifecycle events
@@ -111,8 +118,9 @@ steps:
             recipe_path=recipe_file,
         )
 
-        # Wait briefly for async event tasks to complete
-        await asyncio.sleep(0.1)
+        # Events are emitted inline, so recipe:complete has already arrived;
+        # the timeout only guards against it never being emitted.
+        await asyncio.wait_for(completed.wait(), timeout=2.0)
 
         # Verify events were emitted
         event_names = [event for event, data in events_captured]
@@ -146,21 +154,11 @@ steps:
 
     @pytest.mark.asyncio
     async def test_executor_handles_missing_hooks_gracefully(
-        self, session_manager: SessionManager, temp_project: Path
+        self, session_manager: SessionManager, temp_project: Path, fake_coordinator
     ):
         """Verify executor works when coordinator has no hooks (backwards compatibility)."""
         # Create coordinator WITHOUT hooks
-        coordinator = MagicMock()
-        coordinator.hooks = None  # No hooks available
-        coordinator.display_system = None
-        coordinator.cancellation = None  # Prevent MagicMock truthy cancellation
-
-        async def mock_spawn(**kwargs):
-            return {"output": "Mock result"}
-
-        coordinator.get_capability = MagicMock(return_value=mock_spawn)
-        coordinator.session = MagicMock()
-        coordinator.config = {"agents": {}}
+        coordinator = fake_coordinator(hooks=None, spawn_output="Mock result")
 
         # Create simple recipe
         recipe_yaml = """
@@ -194,7 +192,7 @@ steps:
     @pytest.mark.asyncio
     async def test_hook_emit_uses_correct_api(
         self,
-        coordinator: MagicMock,
+        coordinator: Any,
         session_manager: SessionManager,
         temp_project: Path,
     ):
@@ -236,9 +234,6 @@ steps:
             recipe_path=recipe_file,
         )
 
-        # Wait for background tasks
-        await asyncio.sleep(0.1)
-
         # Verify emit() was called (proving fire() is not being called)
         assert mock_hooks.emit.called, (
             "HookRegistry.emit() was never called - fix may not be working"
@@ -279,23 +274,12 @@ steps:
         return SessionManager(base_dir=sessions_dir, auto_cleanup_days=7)
 
     @pytest.fixture
-    def coordinator(self) -> MagicMock:
-        coordinator = MagicMock()
-        coordinator.hooks = HookRegistry()
-        coordinator.display_system = None
-        coordinator.cancellation = None
-
-        async def mock_spawn(**kwargs):
-            return {"output": "Mock result"}
-
-        coordinator.get_capability = MagicMock(return_value=mock_spawn)
-        coordinator.session = MagicMock()
-        coordinator.config = {"agents": {}}
-        return coordinator
+    def coordinator(self, fake_coordinator) -> Any:
+        return fake_coordinator(hooks=HookRegistry(), spawn_output="Mock result")
 
     async def _run_and_capture_start_event(
         self,
-        coordinator: MagicMock,
+        coordinator: Any,
         session_manager: SessionManager,
         temp_project: Path,
         parent_session_id: str | None,
@@ -329,7 +313,7 @@ steps:
     @pytest.mark.asyncio
     async def test_top_level_recipe_start_has_no_parent_session_id(
         self,
-        coordinator: MagicMock,
+        coordinator: Any,
         session_manager: SessionManager,
         temp_project: Path,
     ):
@@ -344,7 +328,7 @@ steps:
     @pytest.mark.asyncio
     async def test_sub_recipe_start_includes_parent_session_id(
         self,
-        coordinator: MagicMock,
+        coordinator: Any,
         session_manager: SessionManager,
         temp_project: Path,
     ):
@@ -1,6 +1,7 @@
 """Tests for recipe models - Recipe, Step, YAML parsing."""
 
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from amplifier_module_tool_recipes.models import Recipe
@@ -25,72 +26,58 @@ class TestStep:
         errors = sample_step.validate()
         assert errors == []
 
-    def test_step_validation_missing_id(self):
-        """Step without id should fail validation."""
-        step = Step(id="", agent="test", prompt="test")
-        errors = step.validate()
-        assert any("id" in e.lower() for e in errors)
-
-    def test_step_validation_missing_agent(self):
-        """Step without agent should fail validation."""
-        step = Step(id="test", agent="", prompt="test")
-        errors = step.validate()
-        assert any("agent" in e.lower() for e in errors)
-
-    def test_step_validation_missing_prompt(self):
-        """Step without prompt should fail validation."""
-        step = Step(id="test", agent="test", prompt="")
-        errors = step.validate()
-        assert any("prompt" in e.lower() for e in errors)
-
-    def test_step_validation_negative_timeout(self):
-        """Step with negative timeout should fail validation."""
-        step = Step(id="test", agent="test", prompt="test", timeout=-1)
-        errors = step.validate()
-        assert any("timeout" in e.lower() for e in errors)
-
-    def test_step_validation_invalid_on_error(self):
-        """Step with invalid on_error should fail validation."""
-        step = Step(id="test", agent="test", prompt="test", on_error="invalid")
-        errors = step.validate()
-        assert any("on_error" in e.lower() for e in errors)
-
-    def test_step_validation_valid_on_error_values(self):
+    @pytest.mark.parametrize(
+        "overrides,needle",
+        [
+            ({"id": ""}, "id"),
+            ({"agent": ""}, "agent"),
+            ({"prompt": ""}, "prompt"),
+            ({"timeout": -1}, "timeout"),
+            ({"on_error": "invalid"}, "on_error"),
+            ({"output": "invalid!name"}, "output"),
+            ({"output": "recipe"}, "reserved"),
+            ({"output": "session"}, "reserved"),
+            ({"output": "step"}, "reserved"),
+            ({"retry": {"max_attempts": 0}}, "max_attempts"),
+            ({"retry": {"max_attempts": 3, "backoff": "invalid"}}, "backoff"),
+        ],
+        ids=[
+            "missing_id",
+            "missing_agent",
+            "missing_prompt",
+            "negative_timeout",
+            "invalid_on_error",
+            "invalid_output_name",
+            "reserved_output_recipe",
+            "reserved_output_session",
+            "reserved_output_step",
+            "retry_invalid_max_attempts",
+            "retry_invalid_backoff",
+        ],
+    )
+    def test_step_validation_invalid_field(self, overrides: dict, needle: str):
+        """An invalid or missing field produces an error naming it."""
+        fields = {"id": "test", "agent": "test", "prompt": "test", **overrides}
+        errors = Step(**fields).validate()
+        assert any(needle in e.lower() for e in errors)
+
+    @pytest.mark.parametrize("value", ["fail", "continue", "skip_remaining"])
+    def test_step_validation_valid_on_error_values(self, value: str):
         """Step with valid on_error values should pass."""
-        for value in ["fail", "continue", "skip_remaining"]:
-            step = Step(id="test", agent="test", prompt="test", on_error=value)
-            errors = step.validate()
-            assert not any("on_error" in e.lower() for e in errors)
-
-    def test_step_validation_invalid_output_name(self):
-        """Step with invalid output name should fail validation."""
-        step = Step(id="test", agent="test", prompt="test", output="invalid!name")
+        step = Step(id="test", agent="test", prompt="test", on_error=value)
         errors = step.validate()
-        assert any("output" in e.lower() for e in errors)
-
-    def test_step_validation_reserved_output_name(self):
-        """Step with reserved output name should fail validation."""
-        for reserved in ["recipe", "session", "step"]:
-            step = Step(id="test", agent="test", prompt="test", output=reserved)
-            errors = step.validate()
-            assert any("reserved" in e.lower() for e in errors)
-
-    def test_step_validation_retry_invalid_max_attempts(self):
-        """Step with invalid retry max_attempts should fail."""
-        step = Step(id="test", agent="test", prompt="test", retry={"max_attempts": 0})
-        errors = step.validate()
-        assert any("max_attempts" in e.lower() for e in errors)
+        assert not any("on_error" in e.lower() for e in errors)
 
-    def test_step_validation_retry_invalid_backoff(self):
-        """Step with invalid retry backoff should fail."""
-        step = Step(
-            id="test",
-            agent="test",
-            prompt="test",
-            retry={"max_attempts": 3, "backoff": "invalid"},
-        )
-        errors = step.validate()
-        assert any("backoff" in e.lower() for e in errors)
+    def test_bash_step_commands_must_be_list(self):
+        """A bare string for commands is rejected rather than run per character."""
+        errors = Step(id="test", type="bash", commands="ls").validate()  # type: ignore[arg-type]
+        assert any("non-empty list" in e for e in errors)
+
+    def test_step_rejects_unknown_attributes(self):
+        """Step uses slots, so a misspelled field assignment fails loudly."""
+        step = Step(id="test", agent="test", prompt="test")
+        with pytest.raises(AttributeError):
+            step.depend_on = ["other"]  # type: ignore[attr-defined]
 
 
 class TestRecipe:
@@ -107,23 +94,14 @@ class TestRecipe:
         errors = sample_recipe.validate()
         assert errors == []
 
-    def test_recipe_validation_missing_name(self):
-        """Recipe without name should fail validation."""
-        recipe = Recipe(name="", description="test", version="1.0.0", steps=[])
-        errors = recipe.validate()
-        assert any("name" in e.lower() for e in errors)
-
-    def test_recipe_validation_missing_description(self):
-        """Recipe without description should fail validation."""
-        recipe = Recipe(name="test", description="", version="1.0.0", steps=[])
+    @pytest.mark.parametrize("field", ["name", "description", "version"])
+    def test_recipe_validation_missing_field(self, field: str):
+        """Recipe without a required top-level field should fail validation."""
+        fields = {"name": "test", "description": "test", "version": "1.0.0"}
+        fields[field] = ""
+        recipe = Recipe(**fields, steps=[])
         errors = recipe.validate()
-        assert any("description" in e.lower() for e in errors)
-
-    def test_recipe_validation_missing_version(self):
-        """Recipe without version should fail validation."""
-        recipe = Recipe(name="test", description="test", version="", steps=[])
-        errors = recipe.validate()
-        assert any("version" in e.lower() for e in errors)
+        assert any(field in e.lower() for e in errors)
 
     def test_recipe_validation_invalid_name(self):
         """Recipe with invalid name characters should fail."""
@@ -133,36 +111,36 @@ class TestRecipe:
         errors = recipe.validate()
         assert any("name" in e.lower() and "alphanumeric" in e.lower() for e in errors)
 
-    def test_recipe_validation_valid_names(self):
+    @pytest.mark.parametrize(
+        "name", ["test-recipe", "test_recipe", "TestRecipe", "test123"]
+    )
+    def test_recipe_validation_valid_names(self, name: str):
         """Recipe with valid name formats should pass."""
-        valid_names = ["test-recipe", "test_recipe", "TestRecipe", "test123"]
-        for name in valid_names:
-            recipe = Recipe(
-                name=name,
-                description="test",
-                version="1.0.0",
-                steps=[Step(id="s1", agent="a", prompt="p")],
-            )
-            errors = recipe.validate()
-            name_errors = [
-                e for e in errors if "name" in e.lower() and "alphanumeric" in e.lower()
-            ]
-            assert not name_errors, f"Name '{name}' should be valid"
+        recipe = Recipe(
+            name=name,
+            description="test",
+            version="1.0.0",
+            steps=[Step(id="s1", agent="a", prompt="p")],
+        )
+        errors = recipe.validate()
+        name_errors = [
+            e for e in errors if "name" in e.lower() and "alphanumeric" in e.lower()
+        ]
+        assert not name_errors, f"Name '{name}' should be valid"
 
-    def test_recipe_validation_version_format(self):
+    @pytest.mark.parametrize("version", ["1.0", "v1.0.0", "1.0.0-beta", "1.a.0"])
+    def test_recipe_validation_version_format(self, version: str):
         """Recipe version must follow semver format."""
-        invalid_versions = ["1.0", "v1.0.0", "1.0.0-beta", "1.a.0"]
-        for version in invalid_versions:
-            recipe = Recipe(
-                name="test",
-                description="test",
-                version=version,
-                steps=[Step(id="s1", agent="a", prompt="p")],
-            )
-            errors = recipe.validate()
-            assert any("version" in e.lower() for e in errors), (
-                f"Version '{version}' should be invalid"
-            )
+        recipe = Recipe(
+            name="test",
+            description="test",
+            version=version,
+            steps=[Step(id="s1", agent="a", prompt="p")],
+        )
+        errors = recipe.validate()
+        assert any("version" in e.lower() for e in errors), (
+            f"Version '{version}' should be invalid"
+        )
 
     def test_recipe_validation_no_steps(self):
         """Recipe with no steps should fail validation."""
@@ -184,6 +162,23 @@ class TestRecipe:
         errors = recipe.validate()
         assert any("duplicate" in e.lower() for e in errors)
 
+    def test_recipe_validation_duplicate_step_ids_listed_once_in_order(self):
+        """Each repeated step ID appears once, in the order it first repeats."""
+        recipe = Recipe(
+            name="test",
+            description="test",
+            version="1.0.0",
+            steps=[
+                Step(id="b", agent="a", prompt="p"),
+                Step(id="a", agent="a", prompt="p"),
+                Step(id="a", agent="a", prompt="p"),
+                Step(id="b", agent="a", prompt="p"),
+                Step(id="a", agent="a", prompt="p"),
+            ],
+        )
+        errors = recipe.validate()
+        assert "Duplicate step IDs: a, b" in errors
+
     def test_recipe_validation_invalid_depends_on(self):
         """Recipe with invalid depends_on reference should fail."""
         recipe = Recipe(
@@ -281,6 +276,53 @@ class TestRecipeFromYaml:
         assert report_step is not None
         assert "analyze" in report_step.depends_on
 
+    def test_from_yaml_string_matches_file(
+        self, yaml_recipe_file: Path, sample_yaml_content: str
+    ):
+        """from_yaml_string parses text the same way from_yaml parses a file."""
+        assert Recipe.from_yaml_string(sample_yaml_content) == Recipe.from_yaml(
+            yaml_recipe_file
+        )
+
+    def test_from_yaml_string_not_dict(self):
+        """YAML text that's not a dict should raise ValueError."""
+        with pytest.raises(ValueError, match="must be a dictionary"):
+            Recipe.from_yaml_string("- item1\n- item2")
+
+    def test_from_yaml_returns_independent_copies(self, yaml_recipe_file: Path):
+        """Cached loads must not share mutable state between callers."""
+        first = Recipe.from_yaml(yaml_recipe_file)
+        first.steps[0].prompt = "mutated"
+        first.context["file_path"] = "mutated"
+
+        second = Recipe.from_yaml(yaml_recipe_file)
+        assert second is not first
+        assert second.steps[0].prompt != "mutated"
+        assert second.context["file_path"] == "/path/to/file"
+
+    def test_from_yaml_reloads_modified_file(self, temp_dir: Path):
+        """Editing a file invalidates its cached recipe."""
+        recipe_file = temp_dir / "edited.yaml"
+        recipe_file.write_text(
+            "name: before\ndescription: test\nversion: 1.0.0\nsteps: []"
+        )
+        assert Recipe.from_yaml(recipe_file).name == "before"
+
+        recipe_file.write_text(
+            "name: after-edit\ndescription: test\nversion: 1.0.0\nsteps: []"
+        )
+        assert Recipe.from_yaml(recipe_file).name == "after-edit"
+
+    def test_clear_cache_forces_reparse(self, yaml_recipe_file: Path):
+        """clear_cache() drops cached recipes."""
+        Recipe.from_yaml(yaml_recipe_file)
+        Recipe.clear_cache()
+
+        with patch.object(Recipe, "_load_yaml", wraps=Recipe._load_yaml) as load:
+            Recipe.from_yaml(yaml_recipe_file)
+            Recipe.from_yaml(yaml_recipe_file)
+        assert load.call_count == 1
+
 
 class TestCompoundSteps:
     """Tests for compound steps: foreach/while with nested 'steps' bodies.
@@ -305,6 +347,23 @@ class TestCompoundSteps:
         assert len(step.while_steps) == 1
         assert step.while_steps[0]["id"] == "inner"
 
+    def test_parse_step_does_not_mutate_input(self):
+        """Key remapping works on a copy; the raw YAML dict is left intact."""
+        step_data = {
+            "id": "loop",
+            "foreach": "{{items}}",
+            "as": "item",
+            "context": {"x": 1},
+            "steps": [{"id": "inner", "agent": "test", "prompt": "p"}],
+        }
+        Recipe._parse_step(step_data)
+        assert set(step_data) == {"id", "foreach", "as", "context", "steps"}
+
+    def test_parse_step_unknown_key_still_raises(self):
+        """Misspelled step keys are not silently dropped."""
+        with pytest.raises(TypeError, match="agnet"):
+            Recipe._parse_step({"id": "s", "agnet": "a", "prompt": "p"})
+
     def test_parse_step_remaps_steps_for_while_condition(self):
         """'steps' in while_condition blocks also remapped to 'while_steps'."""
         step_data = {
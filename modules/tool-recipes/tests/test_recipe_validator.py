@@ -288,6 +288,23 @@ class TestCheckStepDependencies:
         errors = check_step_dependencies(recipe)
         assert any("itself" in e.lower() for e in errors)
 
+    def test_dependency_cycle(self):
+        """A multi-step cycle is reported through its forward edge."""
+        recipe = Recipe(
+            name="test",
+            description="test",
+            version="1.0.0",
+            steps=[
+                Step(id="s1", agent="a", prompt="First", depends_on=["s3"]),
+                Step(id="s2", agent="b", prompt="Second", depends_on=["s1"]),
+                Step(id="s3", agent="c", prompt="Third", depends_on=["s2"]),
+            ],
+        )
+        errors = check_step_dependencies(recipe)
+        assert errors == [
+            "Step 's1': depends_on 's3' but 's3' appears later in recipe (index 2 >= 0)"
+        ]
+
 
 class TestValidateRecipe:
     """Tests for validate_recipe function."""
@@ -1,17 +1,20 @@
 """Tests for RecipesTool._resolve_path() tilde expansion."""
 
 from pathlib import Path
-from unittest.mock import MagicMock
 
 from amplifier_module_tool_recipes import RecipesTool
 
 
 def _make_tool() -> RecipesTool:
-    """Create a minimally-mocked RecipesTool for unit testing _resolve_path."""
+    """Create a RecipesTool for unit testing _resolve_path.
+
+    Non-@mention paths never touch the collaborators, so bare sentinels stand
+    in for them.
+    """
     return RecipesTool(
-        executor=MagicMock(),
-        session_manager=MagicMock(),
-        coordinator=MagicMock(),
+        executor=object(),  # type: ignore[arg-type]
+        session_manager=object(),  # type: ignore[arg-type]
+        coordinator=object(),  # type: ignore[arg-type]
         config={},
     )
 